@@ -40,7 +40,10 @@ Submodules:
 
 Design Features:
 ----------------
-- High-precision arithmetic with `Decimal` to minimize floating-point errors.
+- High-precision arithmetic with `Decimal` to minimize floating-point errors. The number of
+  significant digits is set package-wide with `compmath.set_precision(n)` (read back with
+  `compmath.get_precision()`, `DEFAULT_PREC = 20`); routines apply it in a local context, so
+  the caller's `decimal` context is left untouched.
 - Support for both symbolic (via `SymPy`) and numerical computations.
 - Modular structure allows for extensibility and integration into larger systems.
 
@@ -83,10 +86,18 @@ print(f'Absolute error: {err}')
 import importlib as _importlib
 
 MODULES = ['math_errors', 'interpolation', 'integration', 'optimize', 'utils']
+# Package-wide Decimal precision controls, re-exported from `utils`.
+PRECISION = ['DEFAULT_PREC', 'get_precision', 'set_precision']
 
 
 def __getattr__(name):
     if name in MODULES:
-        return _importlib.import_module(f'compmath.{name}')
+        module = _importlib.import_module(f'compmath.{name}')
+        globals()[name] = module
+        return module
+    elif name in PRECISION:
+        value = getattr(_importlib.import_module('compmath.utils'), name)
+        globals()[name] = value
+        return value
     else:
         raise AttributeError(f"Module 'compmath' has no attribute '{name}'")
@@ -63,6 +63,11 @@ Usage:
 Each function expects arrays of x and y values representing sampled data points
 and returns the numerical approximation of the integral over the specified interval.
 
+The rules are loaded lazily on first access. The package module uses a `ModuleType`
+subclass that ignores the import system binding the `gauss`, `newton_cotes` and `simpson`
+submodules to the package, so `import compmath.integration.gauss` does not replace the
+public `gauss` function with its module.
+
 Example:
 --------
 ```python
@@ -84,8 +89,45 @@ print(
 print('Gaussian quadrature:', gauss(xp, yp))
 """
 
-from .basic import *
-from .gauss import *
-from .newton_cotes import *
-from .simpson import *
-from .weddle import *
+import importlib as _importlib
+import sys as _sys
+import types as _types
+
+_SUBMODULES = {
+    'rectangle': 'basic',
+    'trapezoid': 'basic',
+    'gauss': 'gauss',
+    'newton_cotes': 'newton_cotes',
+    'simpson': 'simpson',
+    'weddles': 'weddle',
+}
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = _importlib.import_module(f'.{_SUBMODULES[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    else:
+        raise AttributeError(f"Module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _IntegrationModule(_types.ModuleType):
+    # `gauss`, `newton_cotes` and `simpson` share their names with the modules that
+    # define them; keep the import system from shadowing the public objects with
+    # the submodules when those are imported directly. Only the submodule objects
+    # themselves are dropped, any other assignment goes through.
+    def __setattr__(self, name, value):
+        if name in _SUBMODULES and value is _sys.modules.get(f'{self.__name__}.{name}'):
+            return
+        super().__setattr__(name, value)
+
+
+_sys.modules[__name__].__class__ = _IntegrationModule
@@ -1,19 +1,21 @@
-from decimal import Decimal, getcontext
+import math
+from decimal import Decimal
 from typing import Literal, Union
 
 import numpy as np
 
-from ..utils import to_decimal
+from ..utils import decimal_context, to_decimal_pair
 
-getcontext().prec = 20
 __all__ = ['rectangle', 'trapezoid']
 
 
+@decimal_context
 def rectangle(
     xp: np.ndarray,
     yp: np.ndarray,
     method: Literal['left', 'right', 'mid'] = 'left',
     return_type: Literal['Decimal', 'float'] = 'float',
+    high_precision_float: bool = False,
 ) -> Union[Decimal, np.float64]:
     """
     Approximate the integral of a function using the rectangle (left or right or mid) rule.
@@ -27,6 +29,8 @@ def rectangle(
         yp (np.ndarray): A 1D array of y-values corresponding to f(x) evaluated at each x in xp.
         method (Literal["left", "right", "mid"], optional): Choose "left" for left-endpoint rectangles, "right" for right-endpoint rectangles, or "mid" for midpoint rectangles. Defaults to "left".
         return_type (Literal["Decimal", "float"], optional): Determines the return type of the result. Use "Decimal" for high-precision computation or "float" for NumPy float. Defaults to "float".
+        high_precision_float (bool, optional): With `return_type="float"`, sum the weighted terms
+            with `math.fsum` (correctly rounded) instead of a plain dot product. Defaults to False.
 
     Returns:
         Union[Decimal, np.float64]: The approximate value of the integral using the rectangle rule.
@@ -37,31 +41,36 @@ def rectangle(
     if len(xp) < 2:
         raise ValueError('At least two points are required')
 
-    xp = to_decimal(xp)
-    yp = to_decimal(yp)
+    if return_type == 'float':
+        xp = np.asarray(xp, dtype=np.float64)
+        yp = np.asarray(yp, dtype=np.float64)
+    else:
+        xp, yp = to_decimal_pair(xp, yp)
 
-    if method == 'mid':
-        res = to_decimal(0)
-        for i in range(len(xp) - 1):
-            x0, x1 = xp[i], xp[i + 1]
-            y0, y1 = yp[i], yp[i + 1]
-
-            xm = (x0 + x1) / 2
-            ym = y0 + (y1 - y0) * (xm - x0) / (x1 - x0)
+    h = np.diff(xp)
 
-            res += (x1 - x0) * ym
+    if method == 'mid':
+        xm = (xp[:-1] + xp[1:]) / 2
+        heights = yp[:-1] + (yp[1:] - yp[:-1]) * (xm - xp[:-1]) / h
     elif method == 'left':
-        res = np.sum(yp[:-1] * np.diff(xp))
+        heights = yp[:-1]
     elif method == 'right':
-        res = np.sum(yp[1:] * np.diff(xp))
+        heights = yp[1:]
+
+    if return_type == 'float' and high_precision_float:
+        res = math.fsum((h * heights).tolist())
+    else:
+        res = np.dot(h, heights)
 
-    return np.float64(res) if return_type == 'float' else to_decimal(res)
+    return np.float64(res) if return_type == 'float' else res
 
 
+@decimal_context
 def trapezoid(
     xp: np.ndarray,
     yp: np.ndarray,
     return_type: Literal['Decimal', 'float'] = 'float',
+    high_precision_float: bool = False,
 ) -> Union[Decimal, np.float64]:
     """
     Approximate the integral of a function using the trapezoidal rule.
@@ -75,6 +84,8 @@ def trapezoid(
         yp (np.ndarray): A 1D array of y-values corresponding to f(x) evaluated at each x in xp.
         return_type (Literal["Decimal", "float"], optional): Determines the return type of the result.
             Use "Decimal" for high-precision computation or "float" for NumPy float. Defaults to "float".
+        high_precision_float (bool, optional): With `return_type="float"`, sum the weighted terms
+            with `math.fsum` (correctly rounded) instead of a plain dot product. Defaults to False.
 
     Returns:
         Union[Decimal, np.float64]: The approximate value of the integral using the trapezoidal rule.
@@ -82,11 +93,18 @@ def trapezoid(
     Raises:
         ValueError: If xp and yp have inconsistent lengths (checked in utility).
     """
-    xp = to_decimal(xp)
-    yp = to_decimal(yp)
+    if return_type == 'float':
+        xp = np.asarray(xp, dtype=np.float64)
+        yp = np.asarray(yp, dtype=np.float64)
+        if high_precision_float:
+            areas = (yp[:-1] + yp[1:]) * np.diff(xp) / 2
+            return np.float64(math.fsum(areas.tolist()))
+        return np.float64(np.trapezoid(yp, xp))
+
+    xp, yp = to_decimal_pair(xp, yp)
 
-    n = len(xp) - 1
     h = np.diff(xp)
-    res = sum(h[i] * (yp[i] + yp[i + 1]) / 2 for i in range(n))
+    areas = (yp[:-1] + yp[1:]) * h * Decimal('0.5')
+    res = areas.sum()
 
-    return np.float64(res) if return_type == 'float' else to_decimal(res)
+    return res
@@ -1,14 +1,29 @@
-from decimal import Decimal, getcontext
+import math
+from decimal import Decimal
+from functools import lru_cache
 from typing import Literal, Union
 
 import numpy as np
 
-from ..utils import to_decimal
+from ..utils import decimal_context, to_decimal, to_decimal_pair
 
-getcontext().prec = 20
 __all__ = ['gauss']
 
 
+@lru_cache(maxsize=64)
+def _leggauss(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return cached Gauss–Legendre nodes and weights for `n` points.
+
+    The arrays are shared between calls and are therefore marked read-only.
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(n)
+    nodes.setflags(write=False)
+    weights.setflags(write=False)
+    return nodes, weights
+
+
+@decimal_context
 def gauss(
     xp: np.ndarray,
     yp: np.ndarray,
@@ -16,6 +31,7 @@ def gauss(
     a: Union[float, Decimal] = -1,
     b: Union[float, Decimal] = 1,
     return_type: Literal['Decimal', 'float'] = 'float',
+    high_precision_float: bool = False,
 ) -> Union[Decimal, float]:
     """
     Approximate the integral using Gauss–Legendre quadrature with provided x and y values.
@@ -27,25 +43,38 @@ def gauss(
         a (Union[float, Decimal], optional): Lower bound of integration. Default is -1.
         b (Union[float, Decimal], optional): Upper bound of integration. Default is 1.
         return_type (Literal["Decimal", "float"], optional): Result type. Defaults to "float".
+        high_precision_float (bool, optional): With `return_type="float"`, sum the weighted terms
+            with `math.fsum` (correctly rounded) instead of a plain dot product. Defaults to False.
 
     Returns:
         Union[Decimal, float]: Approximate integral of the function on [a, b].
     """
-    xp = to_decimal(xp)
-    yp = to_decimal(yp)
-    a, b = Decimal(str(a)), Decimal(str(b))
-
     n = len(xp)
 
+    if return_type == 'float':
+        yp = np.asarray(yp, dtype=np.float64)
+        if weights is None:
+            _, weights = _leggauss(n)
+        else:
+            weights = np.asarray(weights, dtype=np.float64)
+        if high_precision_float:
+            integral = math.fsum((weights * yp).tolist())
+        else:
+            integral = np.dot(weights, yp)
+        return float((float(b) - float(a)) / 2 * integral)
+
+    xp, yp = to_decimal_pair(xp, yp)
+    a, b = Decimal(str(a)), Decimal(str(b))
+
     if weights is None:
-        _, w = np.polynomial.legendre.leggauss(n)
+        _, w = _leggauss(n)
         weights = to_decimal(w)
 
     else:
         weights = to_decimal(weights)
 
     half = (b - a) / 2
-    integral = sum(weights[i] * yp[i] for i in range(n))
+    integral = np.dot(weights, yp)
     result = half * integral
 
-    return result if return_type == 'Decimal' else float(result)
+    return result
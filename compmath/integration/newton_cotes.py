@@ -1,19 +1,58 @@
-from decimal import Decimal, getcontext
+import math
+from decimal import Decimal
+from functools import lru_cache
 from typing import Literal, Union
 
 import numpy as np
 
-from ..utils import to_decimal
+from ..utils import decimal_context, to_decimal_pair
 
-getcontext().prec = 20
 __all__ = ['newton_cotes']
 
 
+@lru_cache(maxsize=64)
+def _weights(nodes: tuple) -> np.ndarray:
+    """
+    Compute the Newton–Cotes weights w_i = ∫ L_i(x) dx for the given nodes.
+
+    Each Lagrange basis polynomial is written as L_i(x) = c_i * ω(x) / (x - x_i), where
+    c_i = 1 / Π_{j≠i} (x_i - x_j) are the barycentric weights and ω(x) = Π (x - x_j).
+    The quotients ω(x) / (x - x_i) are obtained by synthetic division for all nodes at
+    once and integrated against the monomial moments over [x_0, x_n], which avoids
+    solving a Vandermonde system. The nodes are centred on the interval midpoint first
+    to keep the monomial expansion well conditioned. Results are cached per node tuple and read-only.
+    """
+    xp = np.array(nodes, dtype=np.float64)
+    n = len(xp)
+    c = (xp[0] + xp[-1]) / 2
+    xp -= c
+    a, b = xp[0], xp[-1]
+
+    diff = xp[:, None] - xp[None, :]
+    np.fill_diagonal(diff, 1.0)
+    bary = 1.0 / diff.prod(axis=1)
+
+    omega = np.poly(xp)
+    quot = np.empty((n, n))
+    quot[:, 0] = omega[0]
+    for k in range(1, n):
+        quot[:, k] = omega[k] + xp * quot[:, k - 1]
+
+    m = np.arange(1, n + 1)
+    moments = (b**m - a**m) / m
+
+    weights = bary * (quot[:, ::-1] @ moments)
+    weights.setflags(write=False)
+    return weights
+
+
+@decimal_context
 def newton_cotes(
     xp: np.ndarray,
     yp: np.ndarray,
     coeffs: np.ndarray = None,
     return_type: Literal['Decimal', 'float'] = 'float',
+    high_precision_float: bool = False,
 ) -> Union[Decimal, np.float64]:
     """
     Approximate the integral of a function using the Newton–Cotes formula.
@@ -21,11 +60,15 @@ def newton_cotes(
     This method implements a generalized Newton–Cotes numerical integration rule, which
     approximates the definite integral of a function based on function values at equally or
     unequally spaced nodes. The integration weights (coefficients) are determined automatically
-    by solving a linear system that enforces exact integration of monomials up to degree `n`,
-    where `n = len(xp) - 1`.
+    as the integrals of the Lagrange basis polynomials, so that monomials up to degree `n`,
+    where `n = len(xp) - 1`, are integrated exactly.
 
-    If coefficients are not provided, they are computed based on the Vandermonde matrix
-    and the moments of monomials over the integration interval.
+    If coefficients are not provided, they are computed in float64 from the barycentric
+    weights of the nodes and the moments of monomials over the integration interval, and
+    cached per node grid. For equally spaced nodes the weights depend only on the number
+    of nodes, so the unit-step table for `len(xp)` nodes is reused and scaled by the step.
+    With `return_type="Decimal"` the weights are converted to `Decimal` and applied to the
+    function values in high precision.
 
     Args:
         xp (np.ndarray): A 1D array of x-values representing nodes where the function is evaluated.
@@ -34,6 +77,8 @@ def newton_cotes(
             computed automatically. Defaults to None.
         return_type (Literal["Decimal", "float"], optional): Determines the return type of the result.
             Use "Decimal" for high-precision computation or "float" for NumPy float. Defaults to "float".
+        high_precision_float (bool, optional): With `return_type="float"`, sum the weighted terms
+            with `math.fsum` (correctly rounded) instead of a plain dot product. Defaults to False.
 
     Returns:
         Union[Decimal, np.float64]: The approximate value of the integral using the Newton–Cotes rule.
@@ -41,18 +86,24 @@ def newton_cotes(
     Raises:
         ValueError: If xp and yp have different lengths (handled in `to_decimal` or upstream).
     """
-    xp = to_decimal(xp)
-    yp = to_decimal(yp)
-    coeffs = to_decimal(coeffs) if coeffs is not None else None
+    if coeffs is None:
+        nodes = np.asarray(xp, dtype=np.float64)
+        n = len(nodes)
+        h = np.diff(nodes)
+        if n > 1 and np.allclose(h, h[0], rtol=1e-12, atol=0):
+            step = (nodes[-1] - nodes[0]) / (n - 1)
+            coeffs = step * _weights(tuple(range(n)))
+        else:
+            coeffs = _weights(tuple(nodes.tolist()))
 
-    n = len(xp) - 1
-    a, b = xp[0], xp[-1]
+    if return_type == 'float':
+        yp = np.asarray(yp, dtype=np.float64)
+        coeffs = np.asarray(coeffs, dtype=np.float64)
+        if high_precision_float:
+            return np.float64(math.fsum((coeffs * yp).tolist()))
+        return np.float64(np.dot(coeffs, yp))
 
-    A = np.vander(xp, increasing=True).T
-    rhs = np.array(
-        [(b ** (m + 1) - a ** (m + 1)) / (m + 1) for m in range(n + 1)]
-    )
-    coeffs = np.linalg.solve(A, rhs)
+    coeffs, yp = to_decimal_pair(coeffs, yp)
     res = np.dot(coeffs, yp)
 
-    return np.float64(res) if return_type == 'float' else to_decimal(res)
+    return res
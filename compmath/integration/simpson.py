@@ -1,11 +1,11 @@
-from decimal import Decimal, getcontext
+import math
+from decimal import Decimal
 from typing import Literal, Union
 
 import numpy as np
 
-from ..utils import to_decimal
+from ..utils import decimal_context, to_decimal_pair
 
-getcontext().prec = 20
 __all__ = ['simpson']
 
 
@@ -21,10 +21,12 @@ class __Simpson:
     """
 
     @staticmethod
+    @decimal_context
     def quad(
         xp: np.ndarray,
         yp: np.ndarray,
         return_type: Literal['Decimal', 'float'] = 'float',
+        high_precision_float: bool = False,
     ) -> Union[Decimal, np.float64]:
         """
         Approximate the integral of a function using Simpson's 1/3 rule.
@@ -42,6 +44,8 @@ class __Simpson:
             yp (np.ndarray): A 1D array of y-values corresponding to f(x) at each xp.
             return_type (Literal["Decimal", "float"], optional): Desired return type.
                 Defaults to "float".
+            high_precision_float (bool, optional): With `return_type="float"`, sum the weighted terms
+                with `math.fsum` (correctly rounded) instead of a plain dot product. Defaults to False.
 
         Returns:
             Union[Decimal, np.float64]: Approximate integral of the function.
@@ -49,26 +53,36 @@ class __Simpson:
         Raises:
             ValueError: If the number of intervals is not even.
         """
-        xp = to_decimal(xp)
-        yp = to_decimal(yp)
-
         n = len(xp) - 1
         if n % 2 != 0:
             raise ValueError(
                 "Number of intervals must be even for Simpson's rule"
             )
-        res = to_decimal(0)
-        for i in range(0, n, 2):
-            h = xp[i + 2] - xp[i]
-            res += (h / 6) * (yp[i] + 4 * yp[i + 1] + yp[i + 2])
 
-        return np.float64(res) if return_type == 'float' else to_decimal(res)
+        if return_type == 'float':
+            xp = np.asarray(xp, dtype=np.float64)
+            yp = np.asarray(yp, dtype=np.float64)
+        else:
+            xp, yp = to_decimal_pair(xp, yp)
+
+        h = xp[2::2] - xp[:-2:2]
+        seg_sum = 4 * yp[1::2]
+        seg_sum += yp[:-2:2]
+        seg_sum += yp[2::2]
+        if return_type == 'float' and high_precision_float:
+            res = math.fsum((h / 6 * seg_sum).tolist())
+        else:
+            res = np.dot(h / 6, seg_sum)
+
+        return np.float64(res) if return_type == 'float' else res
 
     @staticmethod
+    @decimal_context
     def cubic(
         xp: np.ndarray,
         yp: np.ndarray,
         return_type: Literal['Decimal', 'float'] = 'float',
+        high_precision_float: bool = False,
     ) -> Union[Decimal, np.float64]:
         """
         Approximate the integral of a function using Simpson's 3/8 rule.
@@ -86,6 +100,8 @@ class __Simpson:
             yp (np.ndarray): A 1D array of y-values corresponding to f(x) at each xp.
             return_type (Literal["Decimal", "float"], optional): Desired return type.
                 Defaults to "float".
+            high_precision_float (bool, optional): With `return_type="float"`, sum the weighted terms
+                with `math.fsum` (correctly rounded) instead of a plain dot product. Defaults to False.
 
         Returns:
             Union[Decimal, np.float64]: Approximate integral of the function.
@@ -93,22 +109,29 @@ class __Simpson:
         Raises:
             ValueError: If the number of intervals is not divisible by 3.
         """
-        xp = to_decimal(xp)
-        yp = to_decimal(yp)
-
         n = len(xp) - 1
         if n % 3 != 0:
             raise ValueError(
                 "Number of intervals must be divisible by 3 for Simpson's 3/8 rule"
             )
-        res = to_decimal(0)
-        for i in range(0, n, 3):
-            h = (xp[i + 3] - xp[i]) / 3
-            res += (3 * h / 8) * (
-                yp[i] + 3 * yp[i + 1] + 3 * yp[i + 2] + yp[i + 3]
-            )
 
-        return np.float64(res) if return_type == 'float' else to_decimal(res)
+        if return_type == 'float':
+            xp = np.asarray(xp, dtype=np.float64)
+            yp = np.asarray(yp, dtype=np.float64)
+        else:
+            xp, yp = to_decimal_pair(xp, yp)
+
+        h = (xp[3::3] - xp[:-3:3]) / 3
+        seg_sum = 3 * yp[1::3]
+        seg_sum += yp[:-3:3]
+        seg_sum += 3 * yp[2::3]
+        seg_sum += yp[3::3]
+        if return_type == 'float' and high_precision_float:
+            res = math.fsum((3 * h / 8 * seg_sum).tolist())
+        else:
+            res = np.dot(3 * h / 8, seg_sum)
+
+        return np.float64(res) if return_type == 'float' else res
 
 
 simpson = __Simpson()
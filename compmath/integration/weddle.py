@@ -1,18 +1,20 @@
-from decimal import Decimal, getcontext
+import math
+from decimal import Decimal
 from typing import Literal, Union
 
 import numpy as np
 
-from ..utils import to_decimal
+from ..utils import decimal_context, to_decimal_pair
 
-getcontext().prec = 20
 __all__ = ['weddles']
 
 
+@decimal_context
 def weddles(
     xp: np.ndarray,
     yp: np.ndarray,
     return_type: Literal['Decimal', 'float'] = 'float',
+    high_precision_float: bool = False,
 ) -> Union[Decimal, np.float64]:
     """
     Approximate the integral of a function using Weddle's rule.
@@ -31,6 +33,8 @@ def weddles(
         yp (np.ndarray): A 1D array of corresponding y-values f(x) at each xp.
         return_type (Literal["Decimal", "float"], optional): Specifies the return type.
             Use "Decimal" for high-precision output or "float" for NumPy float. Defaults to "float".
+        high_precision_float (bool, optional): With `return_type="float"`, sum the weighted terms
+            with `math.fsum` (correctly rounded) instead of a plain dot product. Defaults to False.
 
     Returns:
         Union[Decimal, np.float64]: Approximate value of the definite integral using Weddle's rule.
@@ -38,20 +42,33 @@ def weddles(
     Raises:
         ValueError: If the number of intervals (len(xp) - 1) is not divisible by 6.
     """
-    xp = to_decimal(xp)
-    yp = to_decimal(yp)
-
     n = len(xp) - 1
     if n % 6 != 0:
         raise ValueError(
             "Number of intervals must be divisible by 6 for Weddle's rule"
         )
 
-    res = to_decimal(0)
-    for i in range(0, n, 6):
-        h = (xp[i + 6] - xp[i]) / 6
-        coeffs = [1, 5, 1, 6, 1, 5, 1]
-        segment = [yp[i + j] for j in range(7)]
-        res += (3 * h / 10) * sum(c * y for c, y in zip(coeffs, segment))
+    if return_type == 'float':
+        xp = np.asarray(xp, dtype=np.float64)
+        yp = np.asarray(yp, dtype=np.float64)
+    else:
+        xp, yp = to_decimal_pair(xp, yp)
+
+    h = (xp[6::6] - xp[:-6:6]) / 6
+    # Accumulate f0 + 5f1 + f2 + 6f3 + f4 + 5f5 + f6 in place, left to right,
+    # reusing one scratch buffer for the scaled terms.
+    seg_sum = 5 * yp[1::6]
+    seg_sum += yp[:-6:6]
+    seg_sum += yp[2::6]
+    buf = np.multiply(yp[3::6], 6)
+    seg_sum += buf
+    seg_sum += yp[4::6]
+    np.multiply(yp[5::6], 5, out=buf)
+    seg_sum += buf
+    seg_sum += yp[6::6]
+    if return_type == 'float' and high_precision_float:
+        res = math.fsum((3 * h / 10 * seg_sum).tolist())
+    else:
+        res = np.dot(3 * h / 10, seg_sum)
 
-    return np.float64(res) if return_type == 'float' else to_decimal(res)
+    return np.float64(res) if return_type == 'float' else res
@@ -1,20 +1,48 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal
+from functools import lru_cache
+from typing import Literal
 
 import numpy as np
 
-from ..utils import to_decimal
+from ..utils import decimal_context, get_precision, to_decimal
 
-getcontext().prec = 20
 __all__ = ["difftabs"]
 
 
+@lru_cache(maxsize=64)
+def _fin_table(values: tuple, return_type: str, prec: int) -> tuple[np.ndarray, ...]:
+    """
+    Build the rows of the finite difference table for `values`.
+
+    Tables are cached per values, element type and `Decimal` precision, so repeated
+    interpolation on the same `yp` builds the O(n²) table once. The rows are shared
+    between calls and are therefore marked read-only. `Decimal` values are passed in
+    their string form: equal Decimals such as 1 and 1.0 differ in their digits and
+    must not share a table.
+    """
+    if return_type == "float":
+        table = [np.array(values, dtype=np.float64)]
+    else:
+        table = [np.array([Decimal(v) for v in values], dtype=object)]
+    for _ in range(1, len(values)):
+        table.append(np.diff(table[-1]))
+    for row in table:
+        row.setflags(write=False)
+    return tuple(table)
+
+
 class __DifferenceTables:
     """
     Class for computing difference tables for interpolation methods.
     """
 
     @staticmethod
-    def div(xp: np.ndarray, yp: np.ndarray) -> np.ndarray:
+    @decimal_context
+    def div(
+        xp: np.ndarray,
+        yp: np.ndarray,
+        return_type: Literal["Decimal", "float"] = "Decimal",
+    ) -> np.ndarray:
         """
         Compute the divided differences table used in Newton's interpolation.
 
@@ -28,6 +56,8 @@ class __DifferenceTables:
         Args:
             xp (np.ndarray): A 1D array of x-coordinates of known data points.
             yp (np.ndarray): A 1D array of corresponding y-coordinates.
+            return_type (Literal["Decimal", "float"], optional): Element type of the table. "float"
+                builds it in float64 arithmetic. Defaults to "Decimal".
 
         Returns:
             np.ndarray: A 1D array where each element is a divided difference of increasing order.
@@ -35,23 +65,33 @@ class __DifferenceTables:
         Raises:
             ValueError: If x and y do not have the same length.
         """
-        xp = to_decimal(xp)
-        yp = to_decimal(yp)
+        y_in = yp
+        if return_type == "float":
+            xp = np.asarray(xp, dtype=np.float64)
+            yp = np.asarray(yp, dtype=np.float64)
+        else:
+            xp = to_decimal(xp)
+            yp = to_decimal(yp)
 
         if len(xp) != len(yp):
             raise ValueError("x and y must have the same length")
 
         n = len(xp)
-        table = yp.copy()
+        # The table is filled in place; copy only when `yp` is still the caller's array.
+        table = yp.copy() if yp is y_in else yp
 
         for i in range(1, n):
-            num = table[i:n] - table[i - 1 : n - 1]
-            den = xp[i:n] - xp[: n - i]
-            table[i:n] = num / den
+            num = np.diff(table[i - 1 : n])
+            np.divide(num, xp[i:n] - xp[: n - i], out=table[i:n])
 
         return table
 
-    def fin(self, yp: np.ndarray) -> np.ndarray:
+    @decimal_context
+    def fin(
+        self,
+        yp: np.ndarray,
+        return_type: Literal["Decimal", "float"] = "Decimal",
+    ) -> np.ndarray:
         """
         Generate a table of finite differences for a given set of function values.
 
@@ -59,26 +99,51 @@ class __DifferenceTables:
         forward finite differences of increasing order. It is commonly used for
         Newton-Gregory interpolation when x-values are equally spaced.
 
+        Tables are cached per `yp`, so evaluating many points against the same data pays
+        for the table once. The returned rows are copies the caller is free to modify.
+
         Args:
             yp (np.ndarray): A 1D array of function values.
+            return_type (Literal["Decimal", "float"], optional): Element type of the differences. "float"
+                computes them in float64 arithmetic. Defaults to "Decimal".
 
         Returns:
             List[np.ndarray]: A list where the first array is the original values, and each subsequent array contains higher-order finite differences.
         """
-        yp = to_decimal(yp)
-        table = [np.array(yp, dtype=Decimal)]
+        # The cached rows are shared with the interpolation routines and read-only.
+        return [row.copy() for row in self._table(yp, return_type)]
 
-        for _ in range(1, len(yp)):
-            prev_row = table[-1]
-            next_row = np.array(
-                [prev_row[i] - prev_row[i - 1] for i in range(1, len(prev_row))],
-                dtype=Decimal,
-            )
-            table.append(next_row)
-
-        return table
-
-    def fwd(self, yp: np.ndarray) -> np.ndarray:
+    @staticmethod
+    @decimal_context
+    def _table(
+        yp: np.ndarray, return_type: Literal["Decimal", "float"]
+    ) -> tuple[np.ndarray, ...]:
+        """
+        Return the cached rows of the finite difference table for `yp`.
+        """
+        if return_type == "float":
+            values = tuple(np.asarray(yp, dtype=np.float64).tolist())
+        else:
+            values = tuple(map(str, to_decimal(yp)))
+        return _fin_table(values, return_type, get_precision())
+
+    def _fin_edges(
+        self, yp: np.ndarray, return_type: Literal["Decimal", "float"]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the first and last element of every row of the finite difference table.
+        """
+        table = self._table(yp, return_type)
+        dtype = np.float64 if return_type == "float" else object
+        first = np.array([row[0] for row in table], dtype=dtype)
+        last = np.array([row[-1] for row in table], dtype=dtype)
+        return first, last
+
+    def fwd(
+        self,
+        yp: np.ndarray,
+        return_type: Literal["Decimal", "float"] = "Decimal",
+    ) -> np.ndarray:
         """
         Extract the forward differences from the finite difference table.
 
@@ -88,14 +153,20 @@ class __DifferenceTables:
 
         Args:
             yp (np.ndarray): A 1D array of function values.
+            return_type (Literal["Decimal", "float"], optional): Element type of the differences. "float"
+                computes them in float64 arithmetic. Defaults to "Decimal".
 
         Returns:
             np.ndarray: A 1D array of forward differences.
         """
-        diff = self.fin(yp)
-        return np.array([row[0] for row in diff])
-
-    def bwd(self, yp: np.ndarray) -> np.ndarray:
+        first, _ = self._fin_edges(yp, return_type)
+        return first
+
+    def bwd(
+        self,
+        yp: np.ndarray,
+        return_type: Literal["Decimal", "float"] = "Decimal",
+    ) -> np.ndarray:
         """
         Extract the backward differences from the finite difference table.
 
@@ -105,12 +176,14 @@ class __DifferenceTables:
 
         Args:
             y (np.ndarray): A 1D array of function values.
+            return_type (Literal["Decimal", "float"], optional): Element type of the differences. "float"
+                computes them in float64 arithmetic. Defaults to "Decimal".
 
         Returns:
             np.ndarray: A 1D array of backward differences.
         """
-        diff = self.fin(yp)
-        return np.array([row[-1] for row in diff])
+        _, last = self._fin_edges(yp, return_type)
+        return last
 
 
 difftabs = __DifferenceTables()
@@ -1,23 +1,39 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Literal, Union
 
 import numpy as np
 
-from ..utils import factorial, to_decimal
+from ..utils import decimal_context, factorial, horner, inv_factorials, to_decimal
 from .difftabs import difftabs
 
-getcontext().prec = 20
 __all__ = ['gauss']
 
 
+def _series_float(
+    t: np.ndarray, fd: list, m: int, rows: np.ndarray, shifts: np.ndarray
+) -> Union[np.float64, np.ndarray]:
+    """
+    Evaluate fd[0][m] + Σ_k Π_{j≤k} (t + shifts_j) * fd[k][rows_k] / k! in float64.
+
+    The running products are formed with a single cumulative product instead of a
+    Python loop, and the factorials come from a cached table. An array `t` is
+    evaluated in one pass with the coefficients shared by all points.
+    """
+    n = len(rows)
+    coef = np.array([fd[k][i] for k, i in enumerate(rows, 1)], dtype=np.float64)
+    terms = np.cumprod(np.add.outer(t, shifts), axis=-1)
+    return np.float64(np.float64(fd[0][m]) + terms @ (coef * inv_factorials(n)))
+
+
 class _Gauss:
     """
     Gauss interpolation methods (forward and backward) for equally spaced nodes.
     """
 
     @staticmethod
+    @decimal_context
     def fwd(
-        x: Union[Decimal, float, int, str],
+        x: Union[Decimal, float, int, str, np.ndarray],
         xp: np.ndarray,
         yp: np.ndarray,
         fd: np.ndarray = None,
@@ -27,27 +43,33 @@ class _Gauss:
         Gauss forward interpolation for evenly spaced nodes.
 
         Args:
-            x (Union[Decimal, float, int, str]): Point at which to interpolate.
+            x (Union[Decimal, float, int, str, np.ndarray]): Point at which to interpolate, or an
+                array of points evaluated in one call.
             xp (np.ndarray): Equally spaced x-coordinates.
             yp (np.ndarray): Corresponding y-values.
             fd (np.ndarray, optional): Precomputed finite difference table.
             return_type (Literal["Decimal", "float"], optional): Return type of the result. Defaults to "float".
 
         Returns:
-            Union[Decimal, np.float64]: Interpolated value at x.
+            Union[Decimal, np.float64, np.ndarray]: Interpolated value at x (an array for array input).
 
         Raises:
             ValueError: If input lengths mismatch or fd is invalid.
         """
-        x = to_decimal(x)
-        xp = to_decimal(xp)
-        yp = to_decimal(yp)
+        if return_type == 'float':
+            x = np.asarray(x, dtype=np.float64)
+            xp = np.asarray(xp, dtype=np.float64)
+            yp = np.asarray(yp, dtype=np.float64)
+        else:
+            x = to_decimal(x)
+            xp = to_decimal(xp)
+            yp = to_decimal(yp)
 
         if len(xp) != len(yp):
             raise ValueError('xp and yp must be of equal length.')
 
         if fd is None:
-            fd = difftabs.fin(yp)
+            fd = difftabs.fin(yp, return_type=return_type)
         elif len(fd) != len(yp):
             raise ValueError('fd must have the same length as yp.')
 
@@ -56,20 +78,24 @@ class _Gauss:
         h = xp[1] - xp[0]
         t = (x - xp[m]) / h
 
-        val = fd[0][m]
-        t_prod = to_decimal(1)
+        if return_type == 'float':
+            k = np.arange(1, n + 1)
+            d = k // 2
+            return _series_float(t, fd, m, m - d, np.where(k % 2 == 0, -d, d))
 
+        coeffs = [fd[0][m]]
+        offsets = []
         for k in range(1, n + 1):
             d = k // 2
-            i = m - d
-            t_prod *= (t - d) if k % 2 == 0 else (t + d)
-            val += t_prod * fd[k][i] / factorial(k)
+            coeffs.append(fd[k][m - d] / factorial(k))
+            offsets.append(d if k % 2 == 0 else -d)
 
-        return np.float64(val) if return_type == 'float' else val
+        return horner(coeffs, offsets, t)
 
     @staticmethod
+    @decimal_context
     def bwd(
-        x: Union[Decimal, float, int, str],
+        x: Union[Decimal, float, int, str, np.ndarray],
         xp: np.ndarray,
         yp: np.ndarray,
         fd: np.ndarray = None,
@@ -79,27 +105,33 @@ class _Gauss:
         Gauss backward interpolation for evenly spaced nodes.
 
         Args:
-            x (Union[Decimal, float, int, str]): Point at which to interpolate.
+            x (Union[Decimal, float, int, str, np.ndarray]): Point at which to interpolate, or an
+                array of points evaluated in one call.
             xp (np.ndarray): Equally spaced x-coordinates.
             yp (np.ndarray): Corresponding y-values.
             fd (np.ndarray, optional): Precomputed finite difference table.
             return_type (Literal["Decimal", "float"], optional): Return type of the result. Defaults to "float".
 
         Returns:
-            Union[Decimal, np.float64]: Interpolated value at x.
+            Union[Decimal, np.float64, np.ndarray]: Interpolated value at x (an array for array input).
 
         Raises:
             ValueError: If input lengths mismatch or fd is invalid.
         """
-        x = to_decimal(x)
-        xp = to_decimal(xp)
-        yp = to_decimal(yp)
+        if return_type == 'float':
+            x = np.asarray(x, dtype=np.float64)
+            xp = np.asarray(xp, dtype=np.float64)
+            yp = np.asarray(yp, dtype=np.float64)
+        else:
+            x = to_decimal(x)
+            xp = to_decimal(xp)
+            yp = to_decimal(yp)
 
         if len(xp) != len(yp):
             raise ValueError('xp and yp must be of equal length.')
 
         if fd is None:
-            fd = difftabs.fin(yp)
+            fd = difftabs.fin(yp, return_type=return_type)
         elif len(fd) != len(yp):
             raise ValueError('fd must have the same length as yp.')
 
@@ -108,16 +140,19 @@ class _Gauss:
         h = xp[1] - xp[0]
         t = (x - xp[m]) / h
 
-        val = fd[0][m]
-        t_prod = to_decimal(1)
+        if return_type == 'float':
+            k = np.arange(1, n + 1)
+            d = k // 2
+            return _series_float(t, fd, m, m - (k + 1) // 2, np.where(k % 2 == 0, d, -d))
 
+        coeffs = [fd[0][m]]
+        offsets = []
         for k in range(1, n + 1):
             d = k // 2
-            i = m - (k + 1) // 2
-            t_prod *= (t + d) if k % 2 == 0 else (t - d)
-            val += t_prod * fd[k][i] / factorial(k)
+            coeffs.append(fd[k][m - (k + 1) // 2] / factorial(k))
+            offsets.append(-d if k % 2 == 0 else d)
 
-        return np.float64(val) if return_type == 'float' else val
+        return horner(coeffs, offsets, t)
 
 
 gauss = _Gauss()
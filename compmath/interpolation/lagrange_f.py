@@ -1,17 +1,72 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal
+from functools import lru_cache
 from typing import Callable, Literal, Union
 
 import numpy as np
-from sympy import Basic, Symbol, diff, symbols
+from sympy import Basic, Symbol, symbols
 
-from ..utils import factorial, to_decimal
+from ..utils import decimal_context, factorial, to_decimal
+from .difftabs import difftabs
 
-getcontext().prec = 20
 __all__ = ['lagrange', 'rem', 'lagrange_deriv']
 
 
+@lru_cache(maxsize=64)
+def _denominators(nodes: tuple) -> np.ndarray:
+    """
+    Return Π_{j≠i} (x_i - x_j) for every node as a cached float64 array.
+
+    The denominators depend only on the nodes, so repeated evaluations on the same
+    `xp` skip the O(n²) products. The array is shared and therefore read-only.
+    """
+    xp = np.array(nodes, dtype=np.float64)
+    diffs = xp[:, None] - xp[None, :]
+    np.fill_diagonal(diffs, 1.0)
+    denom = diffs.prod(axis=1)
+    denom.setflags(write=False)
+    return denom
+
+
+def _lagrange_float(x: np.ndarray, xp: np.ndarray, yp: np.ndarray) -> np.float64:
+    """
+    Float64 Lagrange evaluation with vectorized basis polynomials.
+    """
+    # l_i(x) = Π_j (x - x_j) / ((x - x_i) * Π_{j≠i} (x_i - x_j))
+    denom = _denominators(tuple(xp.tolist()))
+
+    diff = np.subtract.outer(x, xp)
+    hit = diff == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        basis = diff.prod(axis=-1, keepdims=True) / (diff * denom)
+    basis = np.where(hit.any(axis=-1, keepdims=True), hit, basis)
+
+    return np.float64(basis @ yp)
+
+
+@decimal_context
+def _lagrange_decimal(x: Decimal, xp: np.ndarray, yp: np.ndarray) -> Decimal:
+    """
+    Exact term-by-term Lagrange evaluation in Decimal arithmetic.
+    """
+    # Differences x - x_j and x_i - x_j are formed once up front (the node matrix in a
+    # single object-array operation) rather than inside the O(n²) loop.
+    num = [x - xj for xj in xp]
+    nodes = xp[:, None] - xp[None, :]
+    val = Decimal(0)
+
+    for i in range(len(xp)):
+        term = Decimal(1)
+        den = nodes[i]
+        for j in range(len(xp)):
+            if i != j:
+                term *= num[j] / den[j]
+        val += yp[i] * term
+
+    return val
+
+
 def lagrange(
-    x: Union[Decimal, float, int, str],
+    x: Union[Decimal, float, int, str, np.ndarray],
     xp: np.ndarray,
     yp: np.ndarray,
     return_type: Literal['Decimal', 'float'] = 'float',
@@ -27,14 +82,21 @@ def lagrange(
     where:
         l_i(x) = Π ((x - x_j) / (x_i - x_j)), for all j ≠ i
 
+    With `return_type="float"` the basis polynomials are evaluated in float64 with
+    vectorized NumPy products: the denominators Π (x_i - x_j) are computed once and an
+    array of points `x` is evaluated as a single (M, n) @ (n,) product. The `Decimal`
+    path keeps the exact term-by-term evaluation. The inputs are converted once here and
+    the matching implementation is called; only the `Decimal` one sets up a context.
+
     Args:
-        x (Union[Decimal, float, int, str]): The point at which to evaluate the interpolated polynomial.
+        x (Union[Decimal, float, int, str, np.ndarray]): The point at which to evaluate the interpolated
+            polynomial, or an array of points evaluated in one call.
         xp (np.ndarray): 1D array of known x-values.
         yp (np.ndarray): 1D array of known y-values corresponding to `xp`.
         return_type (Literal["Decimal", "float"], optional): Specifies the return type.
 
     Returns:
-        Union[Decimal, np.float64]: Interpolated value at x.
+        Union[Decimal, np.float64, np.ndarray]: Interpolated value at x (an array for array input).
 
     Raises:
         ValueError: If input arrays have different lengths or contain fewer than 2 points.
@@ -44,24 +106,29 @@ def lagrange(
             'xp and yp must be the same length and contain at least two points.'
         )
 
-    x = to_decimal(x)
-    xp = to_decimal(xp)
-    yp = to_decimal(yp)
+    if return_type == 'float':
+        return _lagrange_float(
+            np.asarray(x, dtype=np.float64),
+            np.asarray(xp, dtype=np.float64),
+            np.asarray(yp, dtype=np.float64),
+        )
+    return _lagrange_decimal(to_decimal(x), to_decimal(xp), to_decimal(yp))
 
-    val = to_decimal(0)
 
-    for i in range(len(xp)):
-        term = to_decimal(1)
-        for j in range(len(xp)):
-            if i != j:
-                num = x - xp[j]
-                den = xp[i] - xp[j]
-                term *= num / den
-        val += yp[i] * term
+@lru_cache(maxsize=128)
+def _derivative(expr: Basic, order: int, sym: str) -> Basic:
+    """
+    Return the `order`-th symbolic derivative of `expr` with respect to `sym`.
 
-    return np.float64(val) if return_type == 'float' else to_decimal(val)
+    Symbolic differentiation dominates the cost of `rem`, so results are cached per
+    expression, order and symbol name. The expression is built by the caller on every
+    call, so a function whose result changes (e.g. through a closure) is never served a
+    stale derivative and no user function is kept alive by the cache.
+    """
+    return expr.diff(symbols(sym), order)
 
 
+@decimal_context
 def rem(
     x: Union[Decimal, float, int, str],
     xp: np.ndarray,
@@ -86,7 +153,7 @@ def rem(
         x (Union[Decimal, float, int, str]): The x-coordinate where the remainder should be evaluated.
         xp (np.ndarray): 1D array of interpolation nodes.
         f_deriv_at_xi (Union[Decimal, float, int, str], optional): Precomputed (n+1)-th derivative value at some point ξ. If not provided, `f` must be specified.
-        f (Callable[[Symbol], Basic], optional): Symbolic function (SymPy compatible). Used to compute the (n+1)-th derivative if `f_deriv_at_xi` is not provided.
+        f (Callable[[Symbol], Basic], optional): Symbolic function (SymPy compatible). Used to compute the (n+1)-th derivative if `f_deriv_at_xi` is not provided. It is called on every call of `rem` and should be pure; derivatives are cached per resulting expression.
         xi_val (Union[Decimal, float, int, str], optional): The specific point ξ at which to evaluate the derivative. Defaults to the average of xp if not specified.
         sym (str, optional): Symbolic variable name for differentiation. Default is "x".
         return_type (Literal["Decimal", "float"], optional): Whether to return the result as `Decimal` (high precision) or `float` (NumPy float64). Default is "float".
@@ -100,41 +167,36 @@ def rem(
     x = to_decimal(x)
     xp = to_decimal(xp)
     n = len(xp) - 1
-    x_sym = symbols(sym)
 
     if f_deriv_at_xi is None:
         if f is None:
             raise ValueError("Either 'f_deriv_at_xi' or 'f' must be provided.")
         try:
-            f_derivative = f(x_sym).diff(x_sym, n + 1)
+            f_derivative = _derivative(f(symbols(sym)), n + 1, sym)
         except Exception as e:
             raise ValueError(f'Failed to compute the (n+1)-th derivative: {e}')
 
         if xi_val is None:
-            xi_val = to_decimal(sum(xp)) / to_decimal(len(xp))
+            xi_val = sum(xp) / len(xp)
         else:
             xi_val = to_decimal(xi_val)
 
-        f_deriv_at_xi = to_decimal(f_derivative.subs(x_sym, xi_val))
+        f_deriv_at_xi = to_decimal(f_derivative.subs(symbols(sym), xi_val))
     else:
         f_deriv_at_xi = to_decimal(f_deriv_at_xi)
 
-    omega = to_decimal(1)
+    # ω(x) = Π (x - x_i) is evaluated directly; nodes equal to x are skipped.
+    omega_at_x = Decimal(1)
     for xi in xp:
-        if xi == x:
-            continue
-        omega *= x_sym - xi
+        if xi != x:
+            omega_at_x *= x - xi
 
-    omega_at_x = omega.subs(x_sym, x)
-    remainder = f_deriv_at_xi * omega_at_x / to_decimal(factorial(n + 1))
+    remainder = f_deriv_at_xi * omega_at_x / factorial(n + 1)
 
-    return (
-        to_decimal(remainder)
-        if return_type == 'Decimal'
-        else np.float64(remainder)
-    )
+    return remainder if return_type == 'Decimal' else np.float64(remainder)
 
 
+@decimal_context
 def lagrange_deriv(
     x: Union[Decimal, float, int, str],
     k: int,
@@ -145,54 +207,59 @@ def lagrange_deriv(
     """
     Computes the k-th derivative of the Lagrange interpolating polynomial at a given point.
 
+    The interpolating polynomial is taken in Newton form, built from the divided differences
+    c_i = f[x_0, ..., x_i]:
+        P(x) = c_0 + (x - x_0) * (c_1 + (x - x_1) * (c_2 + ...))
+    and its derivatives are evaluated numerically with the extended Horner scheme, which
+    carries the Taylor coefficients p_j = P^(j)(x) / j! for j = 0..k through the nesting:
+        p_j ← p_j * (x - x_i) + p_{j-1}
+    The result is k! * p_k. No symbolic polynomial is formed.
+
     Args:
-        x (Union[Decimal, float, int, str]): The point at which the derivative should be evaluated. Will be converted to Decimal for accuracy.
+        x (Union[Decimal, float, int, str]): The point at which the derivative should be evaluated.
 
         k (int): The order of the derivative to compute.
 
-        xp (np.ndarray): The array of x-values (nodes) used for interpolation. Should be uniformly spaced.
+        xp (np.ndarray): The array of x-values (nodes) used for interpolation.
 
         yp (np.ndarray): The array of y-values corresponding to xp (i.e., f(xp)).
 
-        return_type (Literal["Decimal", "float"], optional): Specifies the return type.
+        return_type (Literal["Decimal", "float"], optional): Specifies the return type. "Decimal" carries
+            out the whole computation in Decimal arithmetic, "float" in float64.
 
     Returns:
         Union[Decimal, np.float64]: The k-th derivative of the Lagrange interpolating polynomial evaluated at x.
 
     Raises:
-        ValueError: If less than two points are provided for interpolation.
-
-    Notes:
-        - The method constructs a symbolic Lagrange interpolating polynomial using SymPy.
-        - It assumes that the x-nodes are equally spaced, which is used for normalization in the denominator.
-        - High precision is maintained throughout using Decimal arithmetic.
-        - The Lagrange polynomial is differentiated symbolically k times and then evaluated at the target point.
+        ValueError: If less than two points are provided for interpolation, the lengths of `xp` and
+            `yp` differ, or `k` is negative.
     """
-    x = to_decimal(x)
-    xp = to_decimal(xp)
-    yp = to_decimal(yp)
+    if return_type == 'float':
+        x = np.float64(x)
+        xp = np.asarray(xp, dtype=np.float64)
+        yp = np.asarray(yp, dtype=np.float64)
+    else:
+        x = to_decimal(x)
+        xp = to_decimal(xp)
+        yp = to_decimal(yp)
 
-    x_sym = symbols('x')
-    L = Decimal(0)
     n = len(xp)
-
     if n < 2:
         raise ValueError('At least two points are required for interpolation.')
+    if k < 0:
+        raise ValueError('The derivative order k must be non-negative.')
 
-    h = xp[1] - xp[0]
-
-    for i in range(n):
-        li = Decimal(1)
-        for j in range(n):
-            if j != i:
-                li *= (x_sym - xp[j]) / ((i - j) * h)
-        L += yp[i] * li
+    coeffs = difftabs.div(xp, yp, return_type=return_type)
+    zero = np.float64(0) if return_type == 'float' else Decimal(0)
 
-    try:
-        L_k = diff(L, x_sym, k)
-    except Exception as e:
-        raise ValueError(f'Failed to compute the {k}-th derivative: {e}')
+    # p[j] holds P^(j)(x) / j!; orders above n - 1 vanish identically.
+    p = [coeffs[n - 1]] + [zero] * min(k, n - 1)
+    for i in range(n - 2, -1, -1):
+        dx = x - xp[i]
+        for j in range(len(p) - 1, 0, -1):
+            p[j] = p[j] * dx + p[j - 1]
+        p[0] = p[0] * dx + coeffs[i]
 
-    L_k_x = L_k.subs(x_sym, x)
+    result = p[k] * factorial(k) if k < len(p) else zero
 
-    return np.float64(L_k_x) if return_type == 'float' else to_decimal(L_k_x)
+    return np.float64(result) if return_type == 'float' else result
@@ -1,12 +1,11 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Literal, Union
 
 import numpy as np
 
-from ..utils import factorial, to_decimal
+from ..utils import decimal_context, factorial, horner, inv_factorials, to_decimal
 from .difftabs import difftabs
 
-getcontext().prec = 20
 __all__ = ['newton']
 
 
@@ -16,57 +15,85 @@ class _Newton:
     """
 
     @staticmethod
+    @decimal_context
     def poly(
-        x: Union[Decimal, float, int, str],
+        x: Union[Decimal, float, int, str, np.ndarray],
         xp: np.ndarray,
         yp: np.ndarray,
         dd: np.ndarray = None,
         return_type: Literal['Decimal', 'float'] = 'float',
+        method: Literal['dd', 'solve'] = 'dd',
     ) -> Union[Decimal, np.float64]:
         """
         Estimate value at `x` using Newton's divided differences interpolation.
 
+        The Newton form is evaluated with Horner's scheme:
+            P(x) = dd[0] + (x - x_0) * (dd[1] + (x - x_1) * (dd[2] + ...))
+
         Args:
-            x (Union[Decimal, float, int, str]): The point to interpolate.
+            x (Union[Decimal, float, int, str, np.ndarray]): The point to interpolate, or an array
+                of points. The divided differences are computed once and shared by all points.
             xp (np.ndarray): Array of known x-coordinates.
             yp (np.ndarray): Array of known y-coordinates.
             dd (np.ndarray, optional): Precomputed divided differences table. If not provided, it will be calculated.
             return_type (Literal["Decimal", "float"], optional): The return type of the result. Defaults to "float".
+            method (Literal["dd", "solve"], optional): "dd" evaluates the Newton form built from divided
+                differences. "solve" (float only) solves the Vandermonde system V c = yp with LAPACK and
+                evaluates the monomial form; it is faster for moderate n but loses accuracy as V becomes
+                ill-conditioned. Defaults to "dd".
 
         Returns:
-            Union[Decimal, np.float64]: Interpolated value at x.
+            Union[Decimal, np.float64, np.ndarray]: Interpolated value at x (an array for array input).
 
         Raises:
-            ValueError: If the input lengths mismatch or dd table is invalid.
+            ValueError: If the input lengths mismatch or dd table is invalid, if `method` is not
+                "dd" or "solve", or if `method="solve"` is combined with `dd` or `return_type="Decimal"`.
         """
-        x = to_decimal(x)
-        xp = to_decimal(xp)
-        yp = to_decimal(yp)
+        if method not in ('dd', 'solve'):
+            raise ValueError("method must be 'dd' or 'solve'")
+        if method == 'solve' and dd is not None:
+            raise ValueError("method='solve' does not use a divided differences table.")
+
+        if return_type == 'float':
+            x = np.asarray(x, dtype=np.float64)
+            xp = np.asarray(xp, dtype=np.float64)
+            yp = np.asarray(yp, dtype=np.float64)
+        else:
+            x = to_decimal(x)
+            xp = to_decimal(xp)
+            yp = to_decimal(yp)
 
         if len(xp) != len(yp):
             raise ValueError('xp and yp must be of equal length.')
 
+        if method == 'solve':
+            if return_type != 'float':
+                raise ValueError("method='solve' requires return_type='float'.")
+            coeffs = np.linalg.solve(np.vander(xp), yp)
+            return np.polyval(coeffs, x)
+
         if dd is None:
-            dd = difftabs.div(xp, yp)
+            dd = difftabs.div(xp, yp, return_type=return_type)
         elif len(dd) != len(yp):
             raise ValueError('Length of dd must match yp.')
+        elif return_type == 'float':
+            dd = np.asarray(dd, dtype=np.float64)
 
+        # Scalar x stays in scalar arithmetic; an array x broadcasts from the first step.
         n = len(xp)
-        x = np.atleast_1d(x)
-        val = np.full_like(x, dd[0], dtype=Decimal)
+        val = dd[n - 1]
 
-        for i in range(1, n):
-            term = dd[i]
-            for j in range(i):
-                term *= x - xp[j]
-            val += term
+        for k in range(n - 2, -1, -1):
+            val = val * (x - xp[k]) + dd[k]
 
-        result = val[0] if val.size > 0 else val
-        return np.float64(result) if return_type == 'float' else result
+        if np.ndim(x) and not np.ndim(val):
+            val = np.full(np.shape(x), val)
+        return np.float64(val) if return_type == 'float' else val
 
     @staticmethod
+    @decimal_context
     def fwd(
-        x: Union[Decimal, float, int, str],
+        x: Union[Decimal, float, int, str, np.ndarray],
         xp: np.ndarray,
         yp: np.ndarray,
         fd: np.ndarray = None,
@@ -76,46 +103,55 @@ class _Newton:
         Estimate value at `x` using Newton's forward difference formula.
 
         Args:
-            x (Union[Decimal, float, int, str]): The point to interpolate.
+            x (Union[Decimal, float, int, str, np.ndarray]): The point to interpolate, or an array
+                of points evaluated in one call.
             xp (np.ndarray): Equally spaced x-coordinates.
             yp (np.ndarray): Corresponding function values.
             fd (np.ndarray, optional): Precomputed forward difference table.
             return_type (Literal["Decimal", "float"], optional): The return type of the result. Defaults to "float".
 
         Returns:
-            Union[Decimal, np.float64]: Interpolated value at x.
+            Union[Decimal, np.float64, np.ndarray]: Interpolated value at x (an array for array input).
 
         Raises:
             ValueError: If input lengths mismatch or fd is invalid.
         """
-        x = to_decimal(x)
-        xp = to_decimal(xp)
-        yp = to_decimal(yp)
+        if return_type == 'float':
+            x = np.asarray(x, dtype=np.float64)
+            xp = np.asarray(xp, dtype=np.float64)
+            yp = np.asarray(yp, dtype=np.float64)
+        else:
+            x = to_decimal(x)
+            xp = to_decimal(xp)
+            yp = to_decimal(yp)
 
         if len(xp) != len(yp):
             raise ValueError('xp and yp must be of equal length.')
 
         n = len(xp)
         if fd is None:
-            fd = difftabs.fwd(yp)
+            fd = difftabs.fwd(yp, return_type=return_type)
         elif len(fd) != n:
             raise ValueError('fd must have the same length as yp.')
 
         h = xp[1] - xp[0]
         t = (x - xp[0]) / h
 
-        val = fd[0]
-        t_prod = to_decimal(1)
+        if return_type == 'float':
+            fd = np.asarray(fd, dtype=np.float64)
+            terms = np.cumprod(np.subtract.outer(t, np.arange(n - 1)), axis=-1)
+            return np.float64(fd[0] + terms @ (fd[1:] * inv_factorials(n - 1)))
 
-        for i in range(1, n):
-            t_prod *= t - (i - 1)
-            val += t_prod * fd[i] / factorial(i)
+        # P(t) = fd[0] + t * (fd[1]/1! + (t - 1) * (fd[2]/2! + ...)), evaluated with Horner.
+        coeffs = [fd[i] / factorial(i) for i in range(n)]
+        val = horner(coeffs, range(n - 1), t)
 
-        return np.float64(val) if return_type == 'float' else val
+        return val
 
     @staticmethod
+    @decimal_context
     def bwd(
-        x: Union[Decimal, float, int, str],
+        x: Union[Decimal, float, int, str, np.ndarray],
         xp: np.ndarray,
         yp: np.ndarray,
         bd: np.ndarray = None,
@@ -125,42 +161,49 @@ class _Newton:
         Estimate value at `x` using Newton's backward difference formula.
 
         Args:
-            x (Union[Decimal, float, int, str]): The point to interpolate.
+            x (Union[Decimal, float, int, str, np.ndarray]): The point to interpolate, or an array
+                of points evaluated in one call.
             xp (np.ndarray): Equally spaced x-coordinates.
             yp (np.ndarray): Corresponding function values.
             bd (np.ndarray, optional): Precomputed backward difference table.
             return_type (Literal["Decimal", "float"], optional): The return type of the result. Defaults to "float".
 
         Returns:
-            Union[Decimal, np.float64]: Interpolated value at x.
+            Union[Decimal, np.float64, np.ndarray]: Interpolated value at x (an array for array input).
 
         Raises:
             ValueError: If input lengths mismatch or bd is invalid.
         """
-        x = to_decimal(x)
-        xp = to_decimal(xp)
-        yp = to_decimal(yp)
+        if return_type == 'float':
+            x = np.asarray(x, dtype=np.float64)
+            xp = np.asarray(xp, dtype=np.float64)
+            yp = np.asarray(yp, dtype=np.float64)
+        else:
+            x = to_decimal(x)
+            xp = to_decimal(xp)
+            yp = to_decimal(yp)
 
         if len(xp) != len(yp):
             raise ValueError('xp and yp must be of equal length.')
 
         n = len(xp)
         if bd is None:
-            bd = difftabs.bwd(yp)
+            bd = difftabs.bwd(yp, return_type=return_type)
         elif len(bd) != n:
             raise ValueError('bd must have the same length as yp.')
 
         h = xp[1] - xp[0]
         t = (x - xp[-1]) / h * -1
 
-        val = bd[0]
-        t_prod = to_decimal(1)
+        if return_type == 'float':
+            bd = np.asarray(bd, dtype=np.float64)
+            terms = np.cumprod(-np.subtract.outer(t, np.arange(n - 1)), axis=-1)
+            return np.float64(bd[0] + terms @ (bd[1:] * inv_factorials(n - 1)))
 
-        for i in range(1, n):
-            t_prod *= t - (i - 1)
-            val += ((-1) ** i) * t_prod * bd[i] / factorial(i)
+        coeffs = [bd[i] / factorial(i) * (-1) ** i for i in range(n)]
+        val = horner(coeffs, range(n - 1), t)
 
-        return np.float64(val) if return_type == 'float' else val
+        return val
 
 
 newton = _Newton()
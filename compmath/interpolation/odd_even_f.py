@@ -1,17 +1,17 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Literal, Union
 
 import numpy as np
 
-from ..utils import to_decimal
+from ..utils import decimal_context, inv_factorials, to_decimal
 from .difftabs import difftabs
 
-getcontext().prec = 20
 __all__ = ['stirling', 'bessel']
 
 
+@decimal_context
 def stirling(
-    x: Union[Decimal, float, int, str],
+    x: Union[Decimal, float, int, str, np.ndarray],
     xp: np.ndarray,
     yp: np.ndarray,
     fd: np.ndarray = None,
@@ -23,27 +23,33 @@ def stirling(
     of the table and the number of points is odd.
 
     Args:
-        x (Union[Decimal, float, int, str]): Interpolation point.
+        x (Union[Decimal, float, int, str, np.ndarray]): Interpolation point, or an array of
+            points evaluated in one call.
         xp (np.ndarray): Equally spaced x-values.
         yp (np.ndarray): Corresponding y-values.
         fd (np.ndarray, optional): Precomputed finite difference table.
         return_type (Literal["Decimal", "float"], optional): Return type. Defaults to "float".
 
     Returns:
-        Union[Decimal, np.float64]: Interpolated value at x.
+        Union[Decimal, np.float64, np.ndarray]: Interpolated value at x (an array for array input).
 
     Raises:
         ValueError: If xp and yp lengths mismatch, fd is invalid,
                     or number of intervals is not odd.
     """
-    x = to_decimal(x)
-    xp = to_decimal(xp)
-    yp = to_decimal(yp)
+    if return_type == 'float':
+        x = np.asarray(x, dtype=np.float64)
+        xp = np.asarray(xp, dtype=np.float64)
+        yp = np.asarray(yp, dtype=np.float64)
+    else:
+        x = to_decimal(x)
+        xp = to_decimal(xp)
+        yp = to_decimal(yp)
 
     if len(xp) != len(yp):
         raise ValueError('xp and yp must be of equal length.')
     if fd is None:
-        fd = difftabs.fin(yp)
+        fd = difftabs.fin(yp, return_type=return_type)
     elif len(fd) != len(yp):
         raise ValueError('fd must have the same length as yp.')
 
@@ -57,9 +63,28 @@ def stirling(
     h = xp[1] - xp[0]
     t = (x - xp[m]) / h
 
+    # Term k carries t * Π_{j=1}^{q} (t² - j²) for odd k = 2q + 1 and
+    # t² * Π_{j=1}^{q-1} (t² - j²) for even k = 2q.
+    if return_type == 'float':
+        k = np.arange(1, n + 1)
+        q = k // 2
+        i = m - q
+        t = t[..., None]
+        core = np.cumprod(
+            np.concatenate([np.ones_like(t), t * t - np.arange(1, m + 1) ** 2], axis=-1),
+            axis=-1,
+        )
+        t_prods = np.where(k % 2 == 1, t * core[..., q], t * t * core[..., q - 1])
+        dks = [
+            (fd[kk][ii - 1] + fd[kk][ii]) / 2 if kk % 2 == 1 else fd[kk][ii]
+            for kk, ii in zip(k, i)
+        ]
+        dks = np.array(dks, dtype=np.float64)
+        return np.float64(fd[0][m] + t_prods @ (dks * inv_factorials(n)))
+
     val = fd[0][m]
-    fact = to_decimal(1)
-    t_prod = t
+    fact = Decimal(1)
+    core = Decimal(1)
 
     for k in range(1, n + 1):
         fact *= k
@@ -67,18 +92,21 @@ def stirling(
 
         if k % 2 == 1:
             dk = (fd[k][i - 1] + fd[k][i]) / 2
-            t_prod *= t**2 - (k // 2) ** 2 if k > 1 else 1
+            if k > 1:
+                core *= t**2 - (k // 2) ** 2
+            t_prod = t * core
         else:
             dk = fd[k][i]
-            t_prod *= t
+            t_prod = t**2 * core
 
         val += (t_prod * dk) / fact
 
     return val if return_type == 'Decimal' else np.float64(val)
 
 
+@decimal_context
 def bessel(
-    x: Union[Decimal, float, int, str],
+    x: Union[Decimal, float, int, str, np.ndarray],
     xp: np.ndarray,
     yp: np.ndarray,
     fd: np.ndarray = None,
@@ -90,21 +118,27 @@ def bessel(
     two central data points (especially with even number of intervals).
 
     Args:
-        x (Union[Decimal, float, int, str]): Interpolation point.
+        x (Union[Decimal, float, int, str, np.ndarray]): Interpolation point, or an array of
+            points evaluated in one call.
         xp (np.ndarray): Equally spaced x-values.
         yp (np.ndarray): Corresponding y-values.
         fd (np.ndarray, optional): Precomputed finite difference table.
         return_type (Literal["Decimal", "float"], optional): Return type. Defaults to "float".
 
     Returns:
-        Union[Decimal, np.float64]: Interpolated value at x.
+        Union[Decimal, np.float64, np.ndarray]: Interpolated value at x (an array for array input).
 
     Raises:
         ValueError: If input data is invalid or n is not odd.
     """
-    x = to_decimal(x)
-    xp = to_decimal(xp)
-    yp = to_decimal(yp)
+    if return_type == 'float':
+        x = np.asarray(x, dtype=np.float64)
+        xp = np.asarray(xp, dtype=np.float64)
+        yp = np.asarray(yp, dtype=np.float64)
+    else:
+        x = to_decimal(x)
+        xp = to_decimal(xp)
+        yp = to_decimal(yp)
 
     n = len(xp) - 1
     if (n + 1) % 2 == 1:
@@ -115,7 +149,7 @@ def bessel(
     if len(xp) != len(yp):
         raise ValueError('xp and yp must be of equal length.')
     if fd is None:
-        fd = difftabs.fin(yp)
+        fd = difftabs.fin(yp, return_type=return_type)
     elif len(fd) != len(yp):
         raise ValueError('fd must have the same length as yp.')
 
@@ -123,9 +157,35 @@ def bessel(
     h = xp[1] - xp[0]
     t = (x - xp[m]) / h
 
+    # Even k = 2q carries E_q = t * (t - q) * Π_{j=1}^{q-1} (t² - j²), odd k = 2q + 1
+    # carries E_q * (t - 1/2), with E_0 = 1.
+    if return_type == 'float':
+        k = np.arange(1, n + 1)
+        q = k // 2
+        i = m - q
+        t = t[..., None]
+        core = np.cumprod(
+            np.concatenate([np.ones_like(t), t * t - np.arange(1, m + 1) ** 2], axis=-1),
+            axis=-1,
+        )
+        even = np.concatenate(
+            [np.ones_like(t), core * t * (t - np.arange(1, m + 2))], axis=-1
+        )
+        t_prods = np.where(k % 2 == 1, even[..., q] * (t - 0.5), even[..., q])
+        dks = [
+            fd[kk][ii] if kk % 2 == 1 else (fd[kk][ii] + fd[kk][ii + 1]) / 2
+            for kk, ii in zip(k, i)
+        ]
+        dks = np.array(dks, dtype=np.float64)
+        base = (np.float64(fd[0][m]) + np.float64(fd[0][m + 1])) / 2
+        return np.float64(base + t_prods @ (dks * inv_factorials(n)))
+
     val = (fd[0][m] + fd[0][m + 1]) / 2
-    fact = to_decimal(1)
-    t_prod = to_decimal(1)
+    fact = Decimal(1)
+    t_prod = Decimal(1)
+    # Running product Π_{j=1}^{q-1} (t² - j²), extended by one factor per even order k = 2q.
+    core = Decimal(1)
+    t2 = t**2
 
     for k in range(1, n + 1):
         fact *= k
@@ -136,10 +196,10 @@ def bessel(
             p = t_prod * (t - Decimal('0.5')) * dk
         else:
             dk = (fd[k][i] + fd[k][i + 1]) / 2
-            t_prod = to_decimal(1)
-            for j in range(1, k // 2):
-                t_prod *= t**2 - j**2
-            t_prod *= t * (t - k // 2)
+            q = k // 2
+            if q > 1:
+                core *= t2 - (q - 1) ** 2
+            t_prod = core * (t * (t - q))
             p = t_prod * dk
 
         val += p / fact
@@ -1,12 +1,11 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Literal, Union
 
 import numpy as np
-import sympy as sp
 
-from ..utils import to_decimal
+from ..optimize import thomasalg
+from ..utils import decimal_context, to_decimal
 
-getcontext().prec = 20
 __all__ = ["hspline"]
 
 
@@ -15,6 +14,7 @@ class __HermiteSpline:
     Cubic Hermite spline interpolation with support for clamped, second derivative, periodic, and not-a-knot boundary conditions.
     """
 
+    @decimal_context
     def __init__(
         self,
         xp: Union[list, np.ndarray],
@@ -32,64 +32,119 @@ class __HermiteSpline:
         self._build_spline()
 
     def _build_spline(self):
+        """
+        Solve for the node slopes `m` and build the per-segment cubic coefficients.
+
+        The slope equations are tridiagonal, so they are assembled as three float64
+        diagonals and solved with the Thomas algorithm in O(n). The not-a-knot end rows
+        touch three unknowns and are folded into the adjacent interior rows. The
+        periodic end rows couple the first and last node and are solved as a dense
+        system.
+        """
         n = self.n
         x, y = self.xp, self.yp
-        h = to_decimal(np.diff(x))
-        A = np.zeros((n, n), dtype=Decimal)
-        rhs = np.zeros(n, dtype=Decimal)
-
-        for i in range(1, n - 1):
-            A[i, i - 1] = h[i] / (h[i - 1] + h[i])
-            A[i, i] = 2
-            A[i, i + 1] = h[i - 1] / (h[i - 1] + h[i])
-            rhs[i] = (
-                3
-                * (
-                    (y[i + 1] - y[i]) / h[i] * h[i - 1]
-                    + (y[i] - y[i - 1]) / h[i - 1] * h[i]
-                )
-                / (h[i - 1] + h[i])
-            )
+        h = np.diff(x)
+        hf = np.array(h, dtype=np.float64)
+        yf = np.array(y, dtype=np.float64)
+
+        lower = np.zeros(n - 1)
+        main = np.full(n, 2.0)
+        upper = np.zeros(n - 1)
+        rhs = np.zeros(n)
+
+        h0, h1 = hf[:-1], hf[1:]
+        lower[:-1] = h1 / (h0 + h1)
+        upper[1:] = h0 / (h0 + h1)
+        rhs[1:-1] = (
+            3
+            * (np.diff(yf[1:]) / h1 * h0 + np.diff(yf[:-1]) / h0 * h1)
+            / (h0 + h1)
+        )
 
         if self.bc_type == "clamped":
             if self.dy_nodes is None:
                 raise ValueError(
                     "dy_nodes must be provided for 'clamped' boundary condition"
                 )
-            A[0, 0], rhs[0] = 1, self.dy_nodes[0]
-            A[-1, -1], rhs[-1] = 1, self.dy_nodes[-1]
+            main[0], rhs[0] = 1, self.dy_nodes[0]
+            main[-1], rhs[-1] = 1, self.dy_nodes[-1]
 
         elif self.bc_type == "second":
             if self.ddy_nodes is None:
                 raise ValueError(
                     "ddy_nodes must be provided for 'second' boundary condition"
                 )
-            A[0, 0], A[0, 1] = 2, 1
-            A[-1, -2], A[-1, -1] = 1, 2
-            rhs[0] = 6 * (y[1] - y[0]) / h[0] / h[0] - h[0] * self.ddy_nodes[0]
-            rhs[-1] = 6 * (y[-1] - y[-2]) / h[-1] / h[-1] - h[-1] * self.ddy_nodes[1]
+            upper[0], lower[-1] = 1, 1
+            ddy = np.array(self.ddy_nodes, dtype=np.float64)
+            rhs[0] = 6 * (yf[1] - yf[0]) / hf[0] / hf[0] - hf[0] * ddy[0]
+            rhs[-1] = 6 * (yf[-1] - yf[-2]) / hf[-1] / hf[-1] - hf[-1] * ddy[1]
 
         elif self.bc_type == "periodic":
+            A = np.diag(main) + np.diag(lower, -1) + np.diag(upper, 1)
+            A[0, :], A[-1, :] = 0, 0
             A[0, 0], A[0, -1] = 1, -1
             A[-1, 0], A[-1, -1] = 1, -1
             rhs[0], rhs[-1] = 0, 0
+            self.m = to_decimal(np.linalg.solve(A, rhs))
 
         else:  # not-a-knot
-            A[0, 0], A[0, 1], A[0, 2] = h[1], -(h[0] + h[1]), h[0]
-            A[-1, -3], A[-1, -2], A[-1, -1] = h[-1], -(h[-2] + h[-1]), h[-2]
-            rhs[0] = rhs[-1] = 0
-
-        self.m = to_decimal(np.linalg.solve(np.float32(A), np.float32(rhs)))
-
-        self.coeffs = []
-        for i in range(n - 1):
-            hi = h[i]
-            ai = y[i]
-            bi = self.m[i]
-            ci = 3 * (y[i + 1] - y[i]) / hi**2 - (2 * self.m[i] + self.m[i + 1]) / hi
-            di = 2 * (y[i] - y[i + 1]) / hi**3 + (self.m[i] + self.m[i + 1]) / hi**2
-            self.coeffs.append((ai, bi, ci, di, x[i]))
-
+            if n < 4:
+                raise ValueError(
+                    "'not-a-knot' boundary condition requires at least 4 nodes"
+                )
+            # Eliminating m_2 from the end row h_1*m_0 - (h_0 + h_1)*m_1 + h_0*m_2 = 0 with
+            # row 1 leaves m_1 = rhs_1 / 3 (mirrored: m_{n-2} = rhs_{n-2} / 3). The inner
+            # slopes follow from rows 2..n-3, the outer two from rows 1 and n-2.
+            m = np.empty(n)
+            m[1], m[-2] = rhs[1] / 3, rhs[-2] / 3
+            if n > 4:
+                r = rhs[2:-2].copy()
+                r[0] -= lower[1] * m[1]
+                r[-1] -= upper[-2] * m[-2]
+                m[2:-2] = thomasalg(main[2:-2], lower[2:-2], upper[2:-2], r)
+            m[0] = (rhs[1] - 2 * m[1] - upper[1] * m[2]) / lower[0]
+            m[-1] = (rhs[-2] - 2 * m[-2] - lower[-2] * m[-3]) / upper[-1]
+            self.m = to_decimal(m)
+
+        if self.bc_type in ("clamped", "second"):
+            self.m = to_decimal(thomasalg(main, lower, upper, rhs))
+
+        # Segment coefficients are kept as rows a, b, c, d of one array (structure of
+        # arrays) in Decimal and in float64, so evaluation can index them by segment.
+        m = self.m
+        dy = np.diff(y)
+        a = y[:-1]
+        b = m[:-1]
+        c = 3 * dy / h**2 - (2 * m[:-1] + m[1:]) / h
+        d = 2 * (y[:-1] - y[1:]) / h**3 + (m[:-1] + m[1:]) / h**2
+        self._seg = np.stack([a, b, c, d])
+        self._seg_f = self._seg.astype(np.float64)
+        self._xp_f = np.array(x, dtype=np.float64)
+
+        # Prefix sums of the whole-segment integrals: _cum[i] = ∫ S over [x_0, x_i].
+        full = h * (a + h * (b / 2 + h * (c / 3 + h * d / 4)))
+        self._cum = np.concatenate([[Decimal(0)], np.cumsum(full)])
+        hf = self._xp_f[1:] - self._xp_f[:-1]
+        af, bf, cf, df = self._seg_f
+        full_f = hf * (af + hf * (bf / 2 + hf * (cf / 3 + hf * df / 4)))
+        self._cum_f = np.concatenate([[0.0], np.cumsum(full_f)])
+        self.coeffs = list(zip(a, b, c, d, x[:-1]))
+
+    def _segments(self, x, return_type: Literal["Decimal", "float"]) -> tuple:
+        """
+        Return the query points as a 1D array, the offsets from their segment's left
+        node, and the a, b, c, d coefficient rows for those segments.
+        """
+        if return_type == "float":
+            x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+            xp, seg = self._xp_f, self._seg_f
+        else:
+            x = to_decimal(np.atleast_1d(x))
+            xp, seg = self.xp, self._seg
+        idx = np.clip(np.searchsorted(xp, x) - 1, 0, self.n - 2)
+        return x, x - xp[idx], seg[:, idx]
+
+    @decimal_context
     def interpolate(
         self,
         x: Union[Decimal, float, int, str],
@@ -104,6 +159,9 @@ class __HermiteSpline:
         The spline is defined piecewise as:
             S_i(x) = a_i + b_i*(x - x_i) + c_i*(x - x_i)^2 + d_i*(x - x_i)^3
 
+        All query points are located with one `searchsorted` and evaluated together in
+        Horner form, ((d_i*dx + c_i)*dx + b_i)*dx + a_i.
+
         Args:
             x (Union[Decimal, float, int, str]): The point or points at which to evaluate the spline.
             return_type (Literal["Decimal", "float"], optional): Specifies the return type. Use "Decimal" for high-precision output, or "float" for NumPy float64. Defaults to "float".
@@ -111,19 +169,15 @@ class __HermiteSpline:
         Returns:
             Union[Decimal, np.ndarray]: Interpolated value(s) at the given point(s).
         """
-        x = to_decimal(np.atleast_1d(x))
-        result = np.zeros_like(x, dtype=Decimal)
-        for idx, x in enumerate(x):
-            i = np.clip(np.searchsorted(self.xp, x) - 1, 0, self.n - 2)
-            ai, bi, ci, di, xi = self.coeffs[i]
-            dx = x - xi
-            result[idx] = ai + bi * dx + ci * dx**2 + di * dx**3
+        _, dx, (a, b, c, d) = self._segments(x, return_type)
+        result = ((d * dx + c) * dx + b) * dx + a
         return (
-            to_decimal(result if len(result) > 1 else result[0])
+            (result if len(result) > 1 else result[0])
             if return_type == "Decimal"
             else np.float64(result)
         )
 
+    @decimal_context
     def derivative(
         self,
         x: Union[float, Decimal, list, np.ndarray],
@@ -135,6 +189,9 @@ class __HermiteSpline:
 
         Computes the analytical derivative of the Hermite spline using its
         piecewise-defined coefficients and evaluates it at the specified point(s).
+        Points are assigned to segments the same way as in `interpolate`, so nodes
+        take the segment to their left and points outside the nodes extend the end
+        segments.
 
         Derivatives are calculated as follows:
             S'_i(x) = b_i + 2*c_i*(x - x_i) + 3*d_i*(x - x_i)^2
@@ -143,43 +200,39 @@ class __HermiteSpline:
 
         Args:
             x (Union[float, Decimal, list, np.ndarray]): The point or points at which to evaluate the derivative.
-            order (int, optional): Order of the derivative (1, 2, or 3). Defaults to 1.
+            order (int, optional): Order of the derivative. Orders above 3 are identically zero. Defaults to 1.
             return_type (Literal["Decimal", "float"], optional): Specifies the return type. Use "Decimal" for high-precision output, or "float" for NumPy float64. Defaults to "float".
 
         Returns:
             Union[Decimal, np.ndarray]: Derivative value(s) at the specified point(s).
 
         Raises:
-            ValueError: If the derivative order is not in [1, 2, 3].
+            ValueError: If the derivative order is negative.
         """
-        x_sym = sp.symbols("x")
-        expr = 0
-
-        for i in range(self.n - 1):
-            xi = float(self.xp[i])
-            x_next = float(self.xp[i + 1])
-            ai, bi, ci, di, _ = [float(c) for c in self.coeffs[i]]
-
-            dx = x_sym - xi
-            poly = ai + bi * dx + ci * dx**2 + di * dx**3
-
-            expr += sp.Piecewise((poly, (x_sym >= xi) & (x_sym <= x_next)), (0, True))
-
-        deriv_expr = sp.diff(expr, x_sym, order)
-
-        x_vals = np.atleast_1d(x)
-        result = np.zeros_like(x_vals, dtype=Decimal)
-
-        for i, x_val in enumerate(x_vals):
-            val = deriv_expr.subs(x_sym, float(x_val))
-            result[i] = to_decimal(val)
+        if order < 0:
+            raise ValueError("Derivative order must be non-negative")
+
+        _, dx, (a, b, c, d) = self._segments(x, return_type)
+        if order == 0:
+            result = ((d * dx + c) * dx + b) * dx + a
+        elif order == 1:
+            result = (3 * d * dx + 2 * c) * dx + b
+        elif order == 2:
+            result = 6 * d * dx + 2 * c
+        elif order == 3:
+            result = 6 * d
+        elif return_type == "float":
+            result = np.zeros(dx.shape)
+        else:
+            result = np.full(dx.shape, Decimal(0))
 
         return (
-            to_decimal(result if len(result) > 1 else result[0])
+            (result if len(result) > 1 else result[0])
             if return_type == "Decimal"
             else np.float64(result)
         )
 
+    @decimal_context
     def integrate(
         self,
         a: Union[float, Decimal],
@@ -194,6 +247,9 @@ class __HermiteSpline:
 
         Each segment is integrated using: ∫ S_i(x) dx = a_i*dx + b_i*dx^2/2 + c_i*dx^3/3 + d_i*dx^4/4
 
+        The integrals over whole segments are accumulated once when the spline is built,
+        so a query costs two searches and the two partial end segments.
+
         Args:
             a (Union[float, Decimal]): Lower bound of the integration interval.
             b (Union[float, Decimal]): Upper bound of the integration interval.
@@ -202,28 +258,33 @@ class __HermiteSpline:
         Returns:
             Union[Decimal, float]: The definite integral of the spline over [a, b].
         """
-        a, b = to_decimal(a), to_decimal(b)
+        if return_type == "float":
+            a, b = np.float64(a), np.float64(b)
+            xp, seg, cum = self._xp_f, self._seg_f, self._cum_f
+        else:
+            a, b = to_decimal(a), to_decimal(b)
+            xp, seg, cum = self.xp, self._seg, self._cum
         if a > b:
             a, b = b, a
 
-        total = Decimal(0)
-        left = np.clip(np.searchsorted(self.xp, a) - 1, 0, self.n - 2)
-        right = np.clip(np.searchsorted(self.xp, b) - 1, 0, self.n - 2)
-
-        x_left = a
-        for i in range(left, right + 1):
-            ai, bi, ci, di, xi = self.coeffs[i]
-            x0 = max(xi, x_left)
-            x1 = min(self.xp[i + 1], b)
-            dx0, dx1 = x0 - xi, x1 - xi
-
-            def polyint(dx):
-                return ai * dx + bi * dx**2 / 2 + ci * dx**3 / 3 + di * dx**4 / 4
-
-            total += polyint(dx1) - polyint(dx0)
-            x_left = x1
+        left = np.clip(np.searchsorted(xp, a) - 1, 0, self.n - 2)
+        right = np.clip(np.searchsorted(xp, b) - 1, 0, self.n - 2)
+
+        def polyint(i, x):
+            ai, bi, ci, di = seg[:, i]
+            dx = x - xp[i]
+            return dx * (ai + dx * (bi / 2 + dx * (ci / 3 + dx * di / 4)))
+
+        # Whole segments left..right-1 come from the prefix sums; only the two
+        # partial ends are integrated here.
+        total = (
+            cum[right]
+            - cum[left]
+            + polyint(right, min(xp[right + 1], b))
+            - polyint(left, max(xp[left], a))
+        )
 
-        return to_decimal(total) if return_type == "Decimal" else np.float64(total)
+        return total if return_type == "Decimal" else np.float64(total)
 
 
 hspline = __HermiteSpline
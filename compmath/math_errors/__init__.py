@@ -27,18 +27,21 @@ Features:
 - **Condition Numbers**:
   - Compute absolute and relative condition numbers for functions.
   - Measure the sensitivity of a function's output to changes in its input.
+  - Sweep condition numbers over many points at once in float64.
 
 - **Approximate Numbers**:
   - Represent numbers with associated absolute and relative errors.
   - Perform arithmetic operations with proper error propagation.
+  - Propagate errors for whole arrays of approximate numbers at once in float64.
 
 Modules:
 --------
 - `round`: Provides utilities for rounding numbers to significant, valid, or doubtful digits.
 - `errors`: Contains functions for calculating absolute and relative errors.
 - `digits_analysis`: Analyzes significant, valid, and doubtful digits of a number.
-- `cond_nums`: Computes absolute and relative condition numbers for functions.
+- `cond_nums`: Computes absolute and relative condition numbers for functions, at one point or many.
 - `approx_num`: Represents approximate numbers with error bounds and supports arithmetic operations.
+- `approx_array`: Stores many approximate numbers as float64 arrays and propagates their errors in bulk.
 
 Usage:
 ------
@@ -56,6 +59,7 @@ from compmath.math_errors import (
     digits_analysis,
     cond_nums,
     ApproxNum,
+    ApproxArray,
 )
 
 # Example 1: Calculate absolute and relative errors
@@ -89,8 +93,13 @@ print(
 
 # Example 5: Work with approximate numbers
 approx = ApproxNum(3.14159, abs_err=0.001)
-print(f'Approximate Number: {approx}')"""
+print(f'Approximate Number: {approx}')
 
+# Example 6: Propagate errors for many numbers at once
+values = ApproxArray([1.5, 2.25, 3.1], abs_errs=0.01)
+print(f'Total: {(values * 2).sum()}')"""
+
+from .approx_array import *
 from .approx_num import *
 from .cond_nums import *
 from .digits_analysis import *
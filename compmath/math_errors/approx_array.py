@@ -0,0 +1,327 @@
+import math
+from typing import Iterable, List, Union
+
+import numpy as np
+
+from .approx_num import ApproxNum
+from .errors import absolute_error
+
+__all__ = ['ApproxArray']
+
+_LN10 = math.log(10)
+
+
+def _ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """
+    Return num / den elementwise, with infinity where the denominator is zero.
+    """
+    num, den = np.broadcast_arrays(num, den)
+    return np.divide(num, den, out=np.full(num.shape, np.inf), where=den != 0)
+
+
+class ApproxArray:
+    """A float64 array of approximate numbers with absolute and relative error bounds.
+
+    This is the bulk counterpart of `ApproxNum`: values and errors are stored as three
+    parallel float64 arrays, and every operation propagates the errors for all elements
+    at once with NumPy ufuncs, using the same rules as `ApproxNum`. It trades the Decimal
+    precision of `ApproxNum` for speed when many approximate numbers are processed
+    together. Where a relative error would divide by zero it is set to infinity.
+
+    Attributes:
+        values (Union[np.ndarray, list, float]):
+            The central values of the approximate numbers.
+        abs_errs (Union[np.ndarray, list, float], optional):
+            The absolute errors, broadcast against `values`. If neither error is provided,
+            they are calculated per element (all digits are considered significant).
+        rel_errs (Union[np.ndarray, list, float], optional):
+            The relative errors, broadcast against `values`. If not provided, they are
+            calculated from the absolute errors.
+    """
+
+    def __init__(
+        self,
+        values: Union[np.ndarray, list, float],
+        abs_errs: Union[np.ndarray, list, float] = None,
+        rel_errs: Union[np.ndarray, list, float] = None,
+    ):
+        self._values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        shape = self._values.shape
+
+        if abs_errs is None and rel_errs is None:
+            self._abs_errs = np.array(
+                [absolute_error(v) for v in self._values.ravel().tolist()]
+            ).reshape(shape)
+            self._rel_errs = _ratio(self._abs_errs, np.abs(self._values))
+        elif abs_errs is None:
+            self._rel_errs = self._errors(rel_errs, shape)
+            self._abs_errs = np.abs(self._values) * self._rel_errs
+        else:
+            self._abs_errs = self._errors(abs_errs, shape)
+            self._rel_errs = (
+                _ratio(self._abs_errs, np.abs(self._values))
+                if rel_errs is None
+                else self._errors(rel_errs, shape)
+            )
+
+    @staticmethod
+    def _errors(errs: Union[np.ndarray, list, float], shape: tuple) -> np.ndarray:
+        return np.abs(np.broadcast_to(np.asarray(errs, dtype=np.float64), shape))
+
+    @classmethod
+    def from_approxnum_list(cls, nums: Iterable[ApproxNum]) -> 'ApproxArray':
+        """
+        Builds an ApproxArray from a sequence of ApproxNum objects.
+
+        Args:
+            nums (Iterable[ApproxNum]): The approximate numbers to convert.
+
+        Returns:
+            ApproxArray: The numbers with their errors as float64 arrays.
+        """
+        nums = list(nums)
+        return cls(
+            [float(n.value) for n in nums],
+            [float(n.abs_err) for n in nums],
+            [float(n.rel_err) for n in nums],
+        )
+
+    def to_approxnum_list(self) -> List[ApproxNum]:
+        """
+        Converts the array back to a list of ApproxNum objects.
+
+        Returns:
+            List[ApproxNum]: One ApproxNum per element, with its errors.
+        """
+        return [
+            ApproxNum(v, a, r)
+            for v, a, r in zip(
+                self._values.ravel().tolist(),
+                self._abs_errs.ravel().tolist(),
+                self._rel_errs.ravel().tolist(),
+            )
+        ]
+
+    def __repr__(self) -> str:
+        return f'ApproxArray(values={self._values}, abs_errs={self._abs_errs}, rel_errs={self._rel_errs})'
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index) -> Union[ApproxNum, 'ApproxArray']:
+        if np.ndim(self._values[index]) == 0:
+            return ApproxNum(
+                float(self._values[index]),
+                float(self._abs_errs[index]),
+                float(self._rel_errs[index]),
+            )
+        return ApproxArray(
+            self._values[index], self._abs_errs[index], self._rel_errs[index]
+        )
+
+    @staticmethod
+    def _operand(other) -> Union['ApproxArray', np.ndarray]:
+        if isinstance(other, ApproxArray):
+            return other
+        if isinstance(other, ApproxNum):
+            return ApproxArray(
+                float(other.value), float(other.abs_err), float(other.rel_err)
+            )
+        return np.asarray(other, dtype=np.float64)
+
+    def __add__(self, other) -> 'ApproxArray':
+        other = self._operand(other)
+        if isinstance(other, ApproxArray):
+            return ApproxArray(
+                self._values + other.values, self._abs_errs + other.abs_errs
+            )
+        return ApproxArray(self._values + other, self._abs_errs)
+
+    def __radd__(self, other) -> 'ApproxArray':
+        return self.__add__(other)
+
+    def __sub__(self, other) -> 'ApproxArray':
+        other = self._operand(other)
+        if isinstance(other, ApproxArray):
+            return ApproxArray(
+                self._values - other.values, self._abs_errs + other.abs_errs
+            )
+        return ApproxArray(self._values - other, self._abs_errs)
+
+    def __rsub__(self, other) -> 'ApproxArray':
+        other = self._operand(other)
+        if isinstance(other, ApproxArray):
+            return other.__sub__(self)
+        return ApproxArray(other - self._values, self._abs_errs, self._rel_errs)
+
+    def __mul__(self, other) -> 'ApproxArray':
+        other = self._operand(other)
+        if isinstance(other, ApproxArray):
+            return ApproxArray(
+                self._values * other.values,
+                np.abs(other.values) * self._abs_errs
+                + np.abs(self._values) * other.abs_errs,
+                self._rel_errs + other.rel_errs,
+            )
+        return ApproxArray(self._values * other, np.abs(other) * self._abs_errs)
+
+    def __rmul__(self, other) -> 'ApproxArray':
+        return self.__mul__(other)
+
+    def __truediv__(self, other) -> 'ApproxArray':
+        other = self._operand(other)
+        if isinstance(other, ApproxArray):
+            if np.any(other.values == 0):
+                raise ZeroDivisionError('Division by zero')
+            return ApproxArray(
+                self._values / other.values,
+                (
+                    np.abs(other.values) * self._abs_errs
+                    + np.abs(self._values) * other.abs_errs
+                )
+                / other.values**2,
+                self._rel_errs + other.rel_errs,
+            )
+        if np.any(other == 0):
+            raise ZeroDivisionError('Division by zero')
+        return ApproxArray(self._values / other, self._abs_errs / np.abs(other))
+
+    def __rtruediv__(self, other) -> 'ApproxArray':
+        other = self._operand(other)
+        if isinstance(other, ApproxArray):
+            return other.__truediv__(self)
+        if np.any(self._values == 0):
+            raise ZeroDivisionError('Division by zero')
+        return ApproxArray(
+            other / self._values, np.abs(other) * self._abs_errs / self._values**2
+        )
+
+    def __pow__(self, power: Union[int, float]) -> 'ApproxArray':
+        return ApproxArray(
+            self._values**power,
+            abs(power) * self._values ** (power - 1) * self._abs_errs,
+        )
+
+    def sum(self) -> ApproxNum:
+        """
+        Sums all elements with error propagation, as repeated `+` would.
+
+        Returns:
+            ApproxNum: The sum, with the absolute errors added up.
+        """
+        value = float(self._values.sum())
+        abs_err = float(self._abs_errs.sum())
+        rel_err = abs_err / abs(value) if value != 0 else math.inf
+        return ApproxNum(value, abs_err, rel_err)
+
+    def sqrt(self) -> 'ApproxArray':
+        if np.any(self._values < 0):
+            raise ValueError('Square root of negative number')
+        value = np.sqrt(self._values)
+        return ApproxArray(
+            value,
+            _ratio(self._abs_errs, 2 * value),
+            _ratio(self._abs_errs, 2 * self._values),
+        )
+
+    def sin(self) -> 'ApproxArray':
+        value = np.sin(self._values)
+        cos_x = np.abs(np.cos(self._values))
+        return ApproxArray(
+            value, cos_x * self._abs_errs, _ratio(cos_x * self._abs_errs, value)
+        )
+
+    def cos(self) -> 'ApproxArray':
+        value = np.cos(self._values)
+        rel_err = np.where(
+            value != 0, np.abs(np.tan(self._values)) * self._abs_errs, np.inf
+        )
+        return ApproxArray(
+            value, np.abs(np.sin(self._values)) * self._abs_errs, rel_err
+        )
+
+    def tg(self) -> 'ApproxArray':
+        return ApproxArray(
+            np.tan(self._values),
+            self._abs_errs / np.cos(self._values) ** 2,
+            _ratio(2 * self._abs_errs, np.abs(np.sin(2 * self._values))),
+        )
+
+    def ln(self) -> 'ApproxArray':
+        if np.any(self._values <= 0):
+            raise ValueError(
+                'Natural logarithm is defined only for positive numbers'
+            )
+        value = np.log(self._values)
+        return ApproxArray(
+            value,
+            self._abs_errs / self._values,
+            _ratio(self._abs_errs, np.abs(value) * self._values),
+        )
+
+    def lg(self) -> 'ApproxArray':
+        if np.any(self._values <= 0):
+            raise ValueError(
+                'Decimal logarithm is defined only for positive numbers'
+            )
+        value = np.log10(self._values)
+        return ApproxArray(
+            value,
+            self._abs_errs / (self._values * _LN10),
+            _ratio(self._abs_errs, np.abs(value) * self._values * _LN10),
+        )
+
+    def exp(self) -> 'ApproxArray':
+        value = np.exp(self._values)
+        return ApproxArray(
+            value, value * self._abs_errs, np.abs(self._values * self._abs_errs)
+        )
+
+    def pow10(self) -> 'ApproxArray':
+        value = 10.0**self._values
+        return ApproxArray(
+            value, value * _LN10 * self._abs_errs, _LN10 * self._abs_errs
+        )
+
+    def arcsin(self) -> 'ApproxArray':
+        if np.any(np.abs(self._values) >= 1):
+            raise ValueError('Arcsin is defined only for |x| < 1')
+        value = np.arcsin(self._values)
+        sqrt_val = np.sqrt(1 - self._values**2)
+        return ApproxArray(
+            value,
+            self._abs_errs / sqrt_val,
+            _ratio(self._abs_errs, np.abs(value) * sqrt_val),
+        )
+
+    def arccos(self) -> 'ApproxArray':
+        if np.any(np.abs(self._values) >= 1):
+            raise ValueError('Arccos is defined only for |x| < 1')
+        value = np.arccos(self._values)
+        sqrt_val = np.sqrt(1 - self._values**2)
+        return ApproxArray(
+            value,
+            self._abs_errs / sqrt_val,
+            _ratio(self._abs_errs, np.abs(value) * sqrt_val),
+        )
+
+    def arctg(self) -> 'ApproxArray':
+        value = np.arctan(self._values)
+        denom = 1 + self._values**2
+        return ApproxArray(
+            value,
+            self._abs_errs / denom,
+            _ratio(self._abs_errs, np.abs(value) * denom),
+        )
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def abs_errs(self) -> np.ndarray:
+        return self._abs_errs
+
+    @property
+    def rel_errs(self) -> np.ndarray:
+        return self._rel_errs
@@ -1,12 +1,78 @@
 import math
-from decimal import Decimal, getcontext
-from typing import Union
+from decimal import Decimal, getcontext, localcontext
+from functools import lru_cache, wraps
+from typing import Callable, Union
 
-from .errors import absolute_error, relative_error
+from .errors import _TEN, _absolute_error, _key, _to_dec
 
-getcontext().prec = 20
 __all__ = ['ApproxNum']
 
+# Relative error reported when the value is zero.
+_DECIMAL_INF = Decimal('Infinity')
+# The float functions used by the transcendental methods, bound once so that each call
+# is a single global lookup instead of a lookup of `math` followed by an attribute.
+_sin, _cos, _tan = math.sin, math.cos, math.tan
+_asin, _acos, _atan = math.asin, math.acos, math.atan
+
+
+@lru_cache(maxsize=None)
+def _ln10(prec: int) -> Decimal:
+    """
+    Return ln(10) to `prec` significant digits, as used by lg and pow10.
+    """
+    with localcontext() as ctx:
+        ctx.prec = prec
+        return _TEN.ln()
+
+
+def _at_precision(method: Callable) -> Callable:
+    """
+    Run an ApproxNum method in a local context with the instance's precision.
+
+    Entering a local context costs more than the arithmetic of a whole operation, so it
+    is only done when the current context has a different precision; the global context
+    itself is never modified.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args):
+        if getcontext().prec == self._precision:
+            return method(self, *args)
+        with localcontext() as ctx:
+            ctx.prec = self._precision
+            return method(self, *args)
+
+    return wrapper
+
+
+def _absolute_error_at(
+    value: Union[Decimal, float, int, str], rel_err: Union[Decimal, str] = None
+) -> Decimal:
+    """
+    Return `absolute_error(value, rel_err=rel_err)` at the current context precision.
+
+    The public function rounds to the package precision; ApproxNum calls this from its
+    methods, which run at the instance's precision.
+    """
+    return _absolute_error(
+        _key(value), None, None, _key(rel_err), 'Decimal', getcontext().prec
+    )
+
+
+def _product_err(sv: Decimal, sa: Decimal, ov: Decimal, oa: Decimal) -> Decimal:
+    """
+    Return |ov| * sa + |sv| * oa, the error term shared by products and quotients.
+
+    Exact operands (zero error) are common, e.g. integer constants, so a term whose
+    error is zero is skipped instead of being multiplied out. Magnitudes are taken with
+    copy_abs, which only clears the sign; the product rounds to the context anyway.
+    """
+    if not sa:
+        return sv.copy_abs() * oa
+    if not oa:
+        return ov.copy_abs() * sa
+    return ov.copy_abs() * sa + sv.copy_abs() * oa
+
 
 class ApproxNum:
     """A class representing approximate numbers with absolute error bounds.
@@ -21,9 +87,13 @@ class ApproxNum:
         abs_err (Union[Decimal, float, int, str], optional):
             The absolute error (uncertainty) of the number. If not provided, it will be calculated (all numbers are considered significant).
         rel_err (Union[Decimal, float, int, str], optional):
-            The relative error (uncertainty) of the number. If not provided, it will be calculated (all numbers are considered significant).
+            The relative error (uncertainty) of the number. If not provided, it is derived from the absolute error when first accessed (infinite for a zero value).
+        precision (int, optional):
+            The Decimal precision of the number. Its construction, arithmetic and results use it without modifying the global decimal context. Defaults to 20.
     """
 
+    __slots__ = ('_value', '_abs_err', '_rel_err', '_precision')
+
     def __init__(
         self,
         value: Union[Decimal, float, int, str],
@@ -31,264 +101,281 @@ class ApproxNum:
         rel_err: Union[Decimal, float, int, str] = None,
         precision: int = 20,
     ):
-        getcontext().prec = precision
-        self._value = Decimal(str(value))
+        self._precision = precision
+        if getcontext().prec == precision:
+            self._init(value, abs_err, rel_err)
+        else:
+            with localcontext() as ctx:
+                ctx.prec = precision
+                self._init(value, abs_err, rel_err)
+
+    def _init(
+        self,
+        value: Union[Decimal, float, int, str],
+        abs_err: Union[Decimal, float, int, str],
+        rel_err: Union[Decimal, float, int, str],
+    ) -> None:
+        self._value = _to_dec(value)
 
         if abs_err is None and rel_err is None:
-            self._abs_err = absolute_error(value, return_type='Decimal')
-            self._rel_err = relative_error(
-                value=value, abs_err=abs_err, return_type='Decimal'
-            )
+            self._abs_err = _absolute_error_at(value)
+            self._rel_err = None
         elif abs_err is None:
-            self._abs_err = absolute_error(
-                value=value, rel_err=rel_err, return_type='Decimal'
-            )
-            self._rel_err = abs(Decimal(str(rel_err)))
+            self._abs_err = _absolute_error_at(value, rel_err)
+            self._rel_err = abs(_to_dec(rel_err))
         elif rel_err is None:
-            self._abs_err = abs(Decimal(str(abs_err)))
-            self._rel_err = relative_error(
-                value=value, abs_err=abs_err, return_type='Decimal'
-            )
+            self._abs_err = abs(_to_dec(abs_err))
+            self._rel_err = None
         else:
-            self._abs_err = abs(Decimal(str(abs_err)))
-            self._rel_err = abs(Decimal(str(rel_err)))
+            self._abs_err = abs(_to_dec(abs_err))
+            self._rel_err = abs(_to_dec(rel_err))
+
+    def _result(
+        self, value: Decimal, abs_err: Decimal, rel_err: Decimal = None
+    ) -> 'ApproxNum':
+        # Results of operations keep the precision of the instance they were computed on.
+        # Their value and errors are already non-negative where required and rounded to
+        # that precision, so the constructor's conversions are bypassed.
+        result = object.__new__(ApproxNum)
+        result._precision = self._precision
+        result._value = value
+        result._abs_err = abs_err
+        result._rel_err = rel_err
+        return result
 
     def __repr__(self) -> str:
-        return f'ApproxNum(value={self.value}, abs_err={self._abs_err}, rel_err={self._rel_err})'
+        return f'ApproxNum(value={self.value}, abs_err={self._abs_err}, rel_err={self.rel_err})'
 
     def __str__(self) -> str:
-        return f'{self.value} ± {self._abs_err} (δ = {self._rel_err})'
+        return f'{self.value} ± {self._abs_err} (δ = {self.rel_err})'
 
+    @_at_precision
     def __add__(
         self, other: Union['ApproxNum', Decimal, float, int]
     ) -> 'ApproxNum':
+        sv, sa = self._value, self._abs_err
         if isinstance(other, ApproxNum):
-            value = self.value + other.value
-            abs_err = self._abs_err + other.abs_err
-            rel_err = (
-                abs_err / abs(value)
-                if (self.value + other.value) != 0
-                else Decimal('Infinity')
-            )
+            value = sv + other._value
+            abs_err = sa + other._abs_err
+            rel_err = abs_err / value.copy_abs() if value else _DECIMAL_INF
         else:
-            other = Decimal(str(other))
-            value = self.value + other
-            abs_err = self._abs_err
+            value = sv + _to_dec(other)
+            abs_err = sa
             rel_err = None
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
     def __radd__(self, other: Union[Decimal, float, int]) -> 'ApproxNum':
         return self.__add__(other)
 
+    @_at_precision
     def __sub__(
         self, other: Union['ApproxNum', Decimal, float, int]
     ) -> 'ApproxNum':
+        sv, sa = self._value, self._abs_err
         if isinstance(other, ApproxNum):
-            value = self.value - other.value
-            abs_err = self._abs_err + other.abs_err
-            rel_err = (
-                abs_err / abs(value)
-                if (self.value - other.value) != 0
-                else Decimal('Infinity')
-            )
+            value = sv - other._value
+            abs_err = sa + other._abs_err
+            rel_err = abs_err / value.copy_abs() if value else _DECIMAL_INF
         else:
-            other = Decimal(str(other))
-            value = self.value - other
-            abs_err = self._abs_err
+            value = sv - _to_dec(other)
+            abs_err = sa
             rel_err = None
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
+    @_at_precision
     def __rsub__(self, other: Union[Decimal, float, int]) -> 'ApproxNum':
         if isinstance(other, ApproxNum):
             return other.__sub__(self)
-        other = Decimal(str(other))
-        return ApproxNum(other - self.value, self._abs_err, self._rel_err)
+        other = _to_dec(other)
+        return self._result(other - self._value, self._abs_err, self.rel_err)
 
+    @_at_precision
     def __mul__(
         self, other: Union['ApproxNum', Decimal, float, int]
     ) -> 'ApproxNum':
+        sv, sa = self._value, self._abs_err
         if isinstance(other, ApproxNum):
-            value = self.value * other.value
-            abs_err = (
-                abs(other.value) * self._abs_err
-                + abs(self.value) * other.abs_err
-            )
-            rel_err = self._rel_err + other.rel_err
+            ov, oa = other._value, other._abs_err
+            value = sv * ov
+            abs_err = _product_err(sv, sa, ov, oa)
+            rel_err = self.rel_err + other.rel_err
         else:
-            other = Decimal(str(other))
-            value = self.value * other
-            abs_err = abs(other) * self._abs_err
+            ov = _to_dec(other)
+            value = sv * ov
+            abs_err = ov.copy_abs() * sa
             rel_err = None
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
     def __rmul__(self, other: Union[Decimal, float, int]) -> 'ApproxNum':
         return self.__mul__(other)
 
+    @_at_precision
     def __truediv__(
         self, other: Union['ApproxNum', Decimal, float, int]
     ) -> 'ApproxNum':
+        sv, sa = self._value, self._abs_err
         if isinstance(other, ApproxNum):
-            if other.value == 0:
+            ov, oa = other._value, other._abs_err
+            if ov == 0:
                 raise ZeroDivisionError('Division by zero')
-            value = self.value / other.value
-            abs_err = (
-                abs(other.value) * self._abs_err
-                + abs(self.value) * other.abs_err
-            ) / (other.value**2)
-            rel_err = self._rel_err + other.rel_err
+            value = sv / ov
+            abs_err = _product_err(sv, sa, ov, oa) / (ov * ov)
+            rel_err = self.rel_err + other.rel_err
         else:
-            other = Decimal(str(other))
-            if other == 0:
+            ov = _to_dec(other)
+            if ov == 0:
                 raise ZeroDivisionError('Division by zero')
-            value = self.value / other
-            abs_err = self._abs_err / abs(other)
+            value = sv / ov
+            abs_err = sa / ov.copy_abs()
             rel_err = None
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
+    @_at_precision
     def __rtruediv__(self, other: Union[Decimal, float, int]) -> 'ApproxNum':
         if isinstance(other, ApproxNum):
             return other.__truediv__(self)
-        other = Decimal(str(other))
-        if self.value == 0:
+        other = _to_dec(other)
+        sv = self._value
+        if sv == 0:
             raise ZeroDivisionError('Division by zero')
-        return ApproxNum(
-            other / self.value, abs(other) * self._abs_err / (self.value**2)
-        )
+        abs_err = other.copy_abs() * self._abs_err / (sv * sv)
+        return self._result(other / sv, abs_err)
 
+    @_at_precision
     def __pow__(self, power: Union[int, float, Decimal]) -> 'ApproxNum':
-        power = Decimal(str(power))
+        power = _to_dec(power)
         new_value = self.value**power
-        new_error = abs(power) * (self.value ** (power - 1)) * self._abs_err
-        return ApproxNum(new_value, new_error)
+        new_error = (power * self.value ** (power - 1) * self._abs_err).copy_abs()
+        return self._result(new_value, new_error)
 
+    @_at_precision
     def sqrt(self) -> 'ApproxNum':
         if self.value < 0:
             raise ValueError('Square root of negative number')
         value = self.value.sqrt()
         abs_err = (
-            self._abs_err / (Decimal(2) * value)
+            self._abs_err / (value + value)
             if value != 0
-            else Decimal('Infinity')
+            else _DECIMAL_INF
         )
         rel_err = (
-            self._abs_err / (Decimal(2) * self.value)
+            self._abs_err / (self.value + self.value)
             if self.value != 0
-            else Decimal('Infinity')
+            else _DECIMAL_INF
         )
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
+    # For sin, cos and tg the relative error |f'(x)| * dx / |f(x)| equals
+    # abs_err / |value| (e.g. |tan x| * dx = |sin x| * dx / |cos x| for cos), so it is
+    # left to the lazy rel_err property and only the value and one derivative are
+    # converted from float.
+    @_at_precision
     def sin(self) -> 'ApproxNum':
-        value = Decimal(str(math.sin(float(self.value))))
-        abs_err = abs(Decimal(str(math.cos(float(self.value))))) * self._abs_err
-        rel_err = (
-            abs(Decimal(str(math.cos(float(self.value)))))
-            / value
-            * self._abs_err
-            if value != 0
-            else Decimal('Infinity')
-        )
-        return ApproxNum(value, abs_err, rel_err)
+        x = float(self.value)
+        value = Decimal(str(_sin(x)))
+        abs_err = Decimal(str(_cos(x))).copy_abs() * self._abs_err
+        return self._result(value, abs_err)
 
+    @_at_precision
     def cos(self) -> 'ApproxNum':
-        value = Decimal(str(math.cos(float(self.value))))
-        abs_err = abs(Decimal(str(math.sin(float(self.value))))) * self._abs_err
-        rel_err = (
-            abs(Decimal(str(math.tan(float(self.value))))) * self._abs_err
-            if value != 0
-            else Decimal('Infinity')
-        )
-        return ApproxNum(value, abs_err, rel_err)
+        x = float(self.value)
+        value = Decimal(str(_cos(x)))
+        abs_err = Decimal(str(_sin(x))).copy_abs() * self._abs_err
+        return self._result(value, abs_err)
 
+    @_at_precision
     def tg(self) -> 'ApproxNum':
-        value = Decimal(str(math.tan(float(self.value))))
-        cos_x = Decimal(str(math.cos(float(self.value))))
-        abs_err = self._abs_err / (cos_x**2)
-        sin_2x = Decimal(str(math.sin(2 * float(self.value))))
-        rel_err = (
-            (2 * self._abs_err) / abs(sin_2x)
-            if sin_2x != 0
-            else Decimal('Infinity')
-        )
-        return ApproxNum(value, abs_err, rel_err)
+        x = float(self.value)
+        value = Decimal(str(_tan(x)))
+        cos_x = Decimal(str(_cos(x)))
+        abs_err = self._abs_err / (cos_x * cos_x)
+        return self._result(value, abs_err)
 
+    @_at_precision
     def ln(self) -> 'ApproxNum':
         if self.value <= 0:
             raise ValueError(
                 'Natural logarithm is defined only for positive numbers'
             )
-        value = Decimal(str(math.log(float(self.value))))
+        value = self._value.ln()
         abs_err = self._abs_err / self.value
         rel_err = (
-            self._abs_err / (abs(value) * self.value)
+            self._abs_err / (value.copy_abs() * self.value)
             if value != 0
-            else Decimal('Infinity')
+            else _DECIMAL_INF
         )
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
+    @_at_precision
     def lg(self) -> 'ApproxNum':
         if self.value <= 0:
             raise ValueError(
                 'Decimal logarithm is defined only for positive numbers'
             )
-        value = Decimal(str(math.log10(float(self.value))))
-        ln10 = Decimal(str(math.log(10)))
+        value = self._value.log10()
+        ln10 = _ln10(getcontext().prec)
         abs_err = self._abs_err / (self.value * ln10)
         rel_err = (
-            self._abs_err / (abs(value) * self.value * ln10)
+            self._abs_err / (value.copy_abs() * self.value * ln10)
             if value != 0
-            else Decimal('Infinity')
+            else _DECIMAL_INF
         )
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
+    @_at_precision
     def exp(self) -> 'ApproxNum':
-        value = Decimal(str(math.exp(float(self.value))))
+        value = self._value.exp()
         abs_err = value * self._abs_err
-        rel_err = abs(self.value * self._abs_err)
-        return ApproxNum(value, abs_err, rel_err)
+        rel_err = (self.value * self._abs_err).copy_abs()
+        return self._result(value, abs_err, rel_err)
 
+    @_at_precision
     def pow10(self) -> 'ApproxNum':
-        value = Decimal(10) ** self.value
-        ln10 = Decimal(str(math.log(10)))
+        value = _TEN**self.value
+        ln10 = _ln10(getcontext().prec)
         abs_err = value * ln10 * self._abs_err
         rel_err = ln10 * self._abs_err
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
+    @_at_precision
     def arcsin(self) -> 'ApproxNum':
-        if abs(self.value) >= 1:
+        if self.value.copy_abs() >= 1:
             raise ValueError('Arcsin is defined only for |x| < 1')
-        value = Decimal(str(math.asin(float(self.value))))
-        sqrt_val = (1 - self.value**2).sqrt()
+        value = Decimal(str(_asin(float(self.value))))
+        sqrt_val = (1 - self.value * self.value).sqrt()
         abs_err = self._abs_err / sqrt_val
         rel_err = (
-            self._abs_err / (abs(value) * sqrt_val)
+            self._abs_err / (value.copy_abs() * sqrt_val)
             if value != 0
-            else Decimal('Infinity')
+            else _DECIMAL_INF
         )
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
+    @_at_precision
     def arccos(self) -> 'ApproxNum':
-        if abs(self.value) >= 1:
+        if self.value.copy_abs() >= 1:
             raise ValueError('Arccos is defined only for |x| < 1')
-        value = Decimal(str(math.acos(float(self.value))))
-        sqrt_val = (1 - self.value**2).sqrt()
+        value = Decimal(str(_acos(float(self.value))))
+        sqrt_val = (1 - self.value * self.value).sqrt()
         abs_err = self._abs_err / sqrt_val
         rel_err = (
-            self._abs_err / (abs(value) * sqrt_val)
+            self._abs_err / (value.copy_abs() * sqrt_val)
             if value != 0
-            else Decimal('Infinity')
+            else _DECIMAL_INF
         )
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
+    @_at_precision
     def arctg(self) -> 'ApproxNum':
-        value = Decimal(str(math.atan(float(self.value))))
-        denom = 1 + self.value**2
+        value = Decimal(str(_atan(float(self.value))))
+        denom = 1 + self.value * self.value
         abs_err = self._abs_err / denom
         rel_err = (
-            self._abs_err / (abs(value) * denom)
+            self._abs_err / (value.copy_abs() * denom)
             if value != 0
-            else Decimal('Infinity')
+            else _DECIMAL_INF
         )
-        return ApproxNum(value, abs_err, rel_err)
+        return self._result(value, abs_err, rel_err)
 
     @property
     def value(self) -> Decimal:
@@ -302,20 +389,25 @@ class ApproxNum:
     def abs_err(self, value: Union[Decimal, float, int, str]) -> None:
         if isinstance(value, ApproxNum):
             value = value.abs_err
-        self._abs_err = Decimal(str(value))
-        self._rel_err = relative_error(
-            value=self.value, abs_err=self._abs_err, return_type='Decimal'
-        )
+        self._abs_err = _to_dec(value)
+        self._rel_err = None
 
     @property
     def rel_err(self) -> Decimal:
+        # Derived from the absolute error on first access, so intermediate results of
+        # chained arithmetic never pay for a division they do not use.
+        if self._rel_err is None:
+            self._rel_err = self._derived_rel_err()
         return self._rel_err
 
+    @_at_precision
+    def _derived_rel_err(self) -> Decimal:
+        return self._abs_err / self._value.copy_abs() if self._value else _DECIMAL_INF
+
     @rel_err.setter
+    @_at_precision
     def rel_err(self, value: Union[Decimal, float, int, str]) -> None:
         if isinstance(value, ApproxNum):
             value = value.rel_err
-        self._rel_err = Decimal(str(value))
-        self._abs_err = absolute_error(
-            value=self.value, rel_err=self._rel_err, return_type='Decimal'
-        )
+        self._rel_err = _to_dec(value)
+        self._abs_err = _absolute_error_at(self.value, self._rel_err)
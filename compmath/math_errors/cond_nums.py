@@ -1,10 +1,11 @@
-from decimal import Decimal, getcontext
-from typing import Callable, Literal, Union
+from decimal import Decimal, getcontext, localcontext
+from typing import Callable, Literal, Tuple, Union
 
 import numpy as np
 
-getcontext().prec = 20
-__all__ = ['cond_nums']
+from .errors import _to_dec
+
+__all__ = ['cond_nums', 'cond_nums_batch']
 
 
 class __ConditionalNumbers:
@@ -13,6 +14,12 @@ class __ConditionalNumbers:
 
     The condition number provides a measure of how sensitive the output of a function is to changes in its input.
     This class uses Decimal for precise calculations of both absolute and relative condition numbers.
+    The finite-difference derivative (f(x + dX) - f(x)) / dX is computed once on construction
+    (and again on `set_precision`) and shared by `abs` and `rel`. All arithmetic, including
+    the calls to `f`, runs in a local context with the instance's precision, so the global
+    decimal context is left untouched. Function values are converted to Decimal, so plain
+    float functions such as `math.sin` can be used as well. The float results are computed
+    directly in float64 when `f` returns floats, or at precisions of 15 digits or less.
 
     Attributes:
       x (Decimal): The point at which the condition number is evaluated.
@@ -21,6 +28,17 @@ class __ConditionalNumbers:
       fXdX (Decimal): The value of the function at x + dX.
     """
 
+    __slots__ = (
+        '_ctx',
+        '_x',
+        '_dX',
+        '_fX',
+        '_fXdX',
+        '_native',
+        '_dfdx',
+        '_floats',
+    )
+
     def __init__(
         self,
         f: Callable[[Decimal], Decimal],
@@ -41,19 +59,47 @@ class __ConditionalNumbers:
           ValueError: If dX is zero.
           ValueError: If the function value f(x) is zero.
         """
-        getcontext().prec = precision
+        self._ctx = getcontext().copy()
+        self._ctx.prec = precision
 
-        self._x = Decimal(str(x))
-        self._dX = Decimal(str(dX))
+        self._x = _to_dec(x)
+        self._dX = _to_dec(dX)
 
         if self._dX == 0:
             raise ValueError('Parameter dX cannot be zero!')
 
-        self._fX = f(self._x)
-        if self._fX == 0:
-            raise ValueError('Function value f(x) cannot be zero!')
-
-        self._fXdX = f(self._x + self._dX)
+        with localcontext(self._ctx):
+            fX = f(self._x)
+            if fX == 0:
+                raise ValueError('Function value f(x) cannot be zero!')
+
+            fXdX = f(self._x + self._dX)
+        self._fX = _to_dec(fX)
+        self._fXdX = _to_dec(fXdX)
+        # A function returning floats (e.g. math.sin) carries float64 precision only, so
+        # its float results are computed natively from the raw outputs at any precision.
+        self._native = (
+            None
+            if isinstance(fX, Decimal) or isinstance(fXdX, Decimal)
+            else (float(fX), float(fXdX))
+        )
+        self._update_derivative()
+
+    def _update_derivative(self) -> None:
+        """
+        Recomputes the finite-difference derivative at the current precision.
+        """
+        with localcontext(self._ctx):
+            self._dfdx = (self._fXdX - self._fX) / self._dX
+        if self._native:
+            fX, fXdX = self._native
+            self._floats = ((fXdX - fX) / float(self._dX), float(self._x), fX)
+        elif self._ctx.prec <= 15:
+            # Up to 15 digits the Decimal values carry no more than float64 does, so the
+            # float results are taken from float64 copies of them.
+            self._floats = (float(self._dfdx), float(self._x), float(self._fX))
+        else:
+            self._floats = None
 
     @property
     def x(self) -> Decimal:
@@ -82,7 +128,8 @@ class __ConditionalNumbers:
         Args:
           precision (int): The number of significant digits.
         """
-        getcontext().prec = precision
+        self._ctx.prec = precision
+        self._update_derivative()
 
     def abs(
         self, return_type: Literal['Decimal', 'float'] = 'float'
@@ -96,7 +143,11 @@ class __ConditionalNumbers:
         Returns:
           Union[Decimal, np.float64]: The absolute condition number.
         """
-        result = abs((self._fXdX - self._fX) / self._dX)
+        if return_type == 'float' and self._floats:
+            return np.float64(abs(self._floats[0]))
+
+        with localcontext(self._ctx):
+            result = abs(self._dfdx)
         return result if return_type == 'Decimal' else np.float64(result)
 
     def rel(
@@ -111,8 +162,64 @@ class __ConditionalNumbers:
         Returns:
           Union[Decimal, np.float64]: The relative condition number.
         """
-        result = abs((self._fXdX - self._fX) * self._x / (self._fX * self._dX))
+        if return_type == 'float' and self._floats:
+            dfdx, x, fX = self._floats
+            return np.float64(abs(dfdx * x / fX))
+
+        with localcontext(self._ctx):
+            result = abs(self._dfdx * self._x / self._fX)
         return result if return_type == 'Decimal' else np.float64(result)
 
 
 cond_nums = __ConditionalNumbers
+
+
+def _evaluate(f: Callable, xs: np.ndarray) -> np.ndarray:
+    """
+    Evaluates f at every point of xs, in a single call when f accepts arrays.
+    """
+    try:
+        values = np.asarray(f(xs), dtype=np.float64)
+        if values.shape == xs.shape:
+            return values
+    except (TypeError, ValueError):
+        pass
+    return np.fromiter((f(x) for x in xs.tolist()), dtype=np.float64, count=xs.size)
+
+
+def cond_nums_batch(
+    f: Callable[[float], float],
+    xs: Union[np.ndarray, list],
+    dX: float = 0.001,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the absolute and relative condition numbers of a function at many points.
+
+    The float64 counterpart of `cond_nums` for parameter sweeps: the same forward
+    difference (f(x + dX) - f(x)) / dX is evaluated for all points with NumPy. A function
+    that accepts arrays (e.g. `np.sin` or a polynomial lambda) is called once per
+    difference side; any other function is called point by point.
+
+    Args:
+      f (Callable[[float], float]): The function for condition numbers.
+      xs (Union[np.ndarray, list]): Evaluation points.
+      dX (float, optional): Small change for derivative. Defaults to 0.001.
+
+    Raises:
+      ValueError: If dX is zero.
+      ValueError: If the function value f(x) is zero at any point.
+
+    Returns:
+      Tuple[np.ndarray, np.ndarray]: The absolute and the relative condition numbers.
+    """
+    dX = float(dX)
+    if dX == 0:
+        raise ValueError('Parameter dX cannot be zero!')
+
+    xs = np.asarray(xs, dtype=np.float64).ravel()
+    fX = _evaluate(f, xs)
+    if np.any(fX == 0):
+        raise ValueError('Function value f(x) cannot be zero!')
+
+    dfdx = (_evaluate(f, xs + dX) - fX) / dX
+    return np.abs(dfdx), np.abs(dfdx * xs / fX)
@@ -1,13 +1,16 @@
-from decimal import Decimal, getcontext
-from typing import Literal, Union
+from decimal import Decimal
+from typing import Literal, Tuple, Union
 
 import numpy as np
 
-from .errors import absolute_error
+from ..utils import decimal_context
+from .errors import _to_dec, _valid_count, absolute_error
 
-getcontext().prec = 20
 __all__ = ['digits_analysis']
 
+# Decimals are immutable, so the ten digit values are built once and shared.
+_DECIMAL_DIGITS = {digit: Decimal(digit) for digit in '0123456789'}
+
 
 class __DigitsAnalysis:
     """
@@ -17,24 +20,35 @@ class __DigitsAnalysis:
       value (Union[Decimal, float, int, str]): The number to be analyzed.
     """
 
+    __slots__ = (
+        '_dec_number',
+        '_int_part',
+        '_frac_part',
+        '_digits',
+        '_significant',
+        '_splits',
+    )
+
     def __init__(self, value: Union[Decimal, float, int, str]):
         """
         Initializes the __DigitsAnalysis class.
 
         Args:
           value (Union[Decimal, float, int, str]): The number to be analyzed.
+
+        Raises:
+          ValueError: If the value is infinite or NaN.
         """
-        self._dec_number = Decimal(str(value))
-        self._int_part = (
-            str(self._dec_number).split('.')[0][1:]
-            if self._dec_number < 0
-            else str(self._dec_number).split('.')[0]
-        )
-        self._frac_part = (
-            str(self._dec_number).split('.')[1]
-            if '.' in str(self._dec_number)
-            else ''
-        )
+        self._dec_number = _to_dec(value)
+        if not self._dec_number.is_finite():
+            raise ValueError('Digits can only be analyzed for finite numbers')
+        # Fixed-point notation, so values such as 1E-7 are split into plain digits.
+        int_part, _, self._frac_part = format(self._dec_number, 'f').partition('.')
+        self._int_part = int_part.lstrip('-')
+        # The digit string and its significant part are shared by sd, vd, dd and classify.
+        self._digits = self._int_part + self._frac_part
+        self._significant = self._digits.lstrip('0')
+        self._splits = {}
 
     def sd(
         self, return_type: Literal['Decimal', 'float'] = 'float'
@@ -48,17 +62,49 @@ class __DigitsAnalysis:
         Returns:
           np.ndarray: A list of significant digits.
         """
-        str_num = (
-            f'{self._int_part}.{self._frac_part}'
-            if self._frac_part
-            else self._int_part
-        )
-
-        digits = [
-            Decimal(digit) if return_type == 'Decimal' else np.float64(digit)
-            for digit in str_num.replace('.', '').lstrip('0')
-        ]
-        return np.array(digits)
+        return self._to_array(self._significant, return_type)
+
+    @decimal_context
+    def _split(self, abs_err: Union[Decimal, float, int, str, None]) -> Tuple[str, str]:
+        """
+        Splits the digit string into its valid prefix and doubtful suffix.
+
+        The split is cached per absolute error, so `vd`, `dd` and `classify` called with
+        the same error share one classification (and one default error computation).
+        """
+        key = None if abs_err is None else _to_dec(abs_err)
+        if key not in self._splits:
+            err = absolute_error(self._dec_number) if key is None else key
+            digits = self._digits
+            count = _valid_count(err, len(self._int_part), len(digits))
+            self._splits[key] = (digits[:count], digits[count:])
+        return self._splits[key]
+
+    @staticmethod
+    def _to_array(digits: str, return_type: Literal['Decimal', 'float']) -> np.ndarray:
+        if return_type == 'Decimal':
+            return np.array([_DECIMAL_DIGITS[digit] for digit in digits])
+        # The ASCII codes of the digit characters minus ord('0') are the digits themselves.
+        codes = np.frombuffer(digits.encode('ascii'), dtype=np.uint8)
+        return (codes - ord('0')).astype(np.float64)
+
+    def classify(
+        self,
+        abs_err: Union[Decimal, float, int, str] = None,
+        return_type: Literal['Decimal', 'float'] = 'float',
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Splits the digits of the number into valid and doubtful ones in a single pass.
+
+        Args:
+          abs_err (Union[Decimal, float, int, str], optional): The absolute error. If not provided, it will be calculated (all numbers are considered significant).
+          return_type (Literal["Decimal", "float"], optional): The type of the returned digits. Defaults to "float".
+
+        Returns:
+          Tuple[np.ndarray, np.ndarray]: The valid digits and the doubtful digits.
+        """
+        valid, doubtful = self._split(abs_err)
+        return self._to_array(valid, return_type), self._to_array(doubtful, return_type)
 
     def vd(
         self,
@@ -75,26 +121,7 @@ class __DigitsAnalysis:
         Returns:
           np.ndarray: A list of valid digits.
         """
-        if abs_err is None:
-            abs_err = absolute_error(self._dec_number)
-        else:
-            abs_err = Decimal(str(abs_err))
-
-        valid_digits = []
-        digits = self._int_part + self._frac_part
-
-        for i, digit in enumerate(digits):
-            alpha = len(self._int_part) - 2 - i
-            threshold = Decimal('5') * Decimal(10) ** Decimal(alpha)
-
-            if threshold >= abs_err:
-                valid_digits.append(
-                    Decimal(digit)
-                    if return_type == 'Decimal'
-                    else np.float64(digit)
-                )
-
-        return np.array(valid_digits)
+        return self._to_array(self._split(abs_err)[0], return_type)
 
     def dd(
         self,
@@ -111,26 +138,7 @@ class __DigitsAnalysis:
         Returns:
           np.ndarray: A list of doubtful digits.
         """
-        if abs_err is None:
-            abs_err = absolute_error(self._dec_number)
-        else:
-            abs_err = Decimal(str(abs_err))
-
-        doubtful_digits = []
-        digits = self._int_part + self._frac_part
-
-        for i, digit in enumerate(digits):
-            alpha = len(self._int_part) - 2 - i
-            threshold = Decimal('5') * Decimal(10) ** Decimal(alpha)
-
-            if threshold < abs_err:
-                doubtful_digits.append(
-                    Decimal(digit)
-                    if return_type == 'Decimal'
-                    else np.float64(digit)
-                )
-
-        return np.array(doubtful_digits)
+        return self._to_array(self._split(abs_err)[1], return_type)
 
 
 digits_analysis = __DigitsAnalysis
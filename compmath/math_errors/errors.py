@@ -1,11 +1,170 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal, localcontext
+from functools import lru_cache
 from typing import Literal, Optional, Union
 
 import numpy as np
 
-getcontext().prec = 20
+from ..utils import get_precision
+
 __all__ = ['absolute_error', 'relative_error']
 
+_FIVE = Decimal(5)
+_TEN = Decimal(10)
+
+
+def _to_dec(x: Union[Decimal, float, int, str]) -> Decimal:
+    """
+    Convert a value to Decimal through its string form, returning Decimals unchanged.
+
+    Decimal(str(d)) reproduces d exactly, so the string round trip is skipped for the
+    Decimals passed around between the functions and classes of this submodule, while
+    integers and strings are converted directly, which is exact as well. Floats keep the
+    string form: it yields their shortest repr rather than the full binary expansion.
+    """
+    t = type(x)
+    if t is Decimal:
+        return x
+    if t is int or t is str:
+        return Decimal(x)
+    return Decimal(str(x))
+
+
+@lru_cache(maxsize=256)
+def _pow10(n: int) -> Decimal:
+    """
+    Return 10**n as a Decimal.
+
+    Integer powers of ten are exact at any precision, so the results are cached for
+    the digit-place thresholds 5 * 10**n used across this submodule.
+    """
+    return _TEN**n
+
+
+def _valid_count(
+    abs_err: Union[Decimal, float], int_digits: int, total_digits: int
+) -> int:
+    """
+    Return how many leading digits of a number are valid for the given absolute error.
+
+    The digit at position i (counted from the first integer digit) has order
+    alpha = int_digits - 1 - i and is valid when 5 * 10**(alpha - 1) >= abs_err. The
+    condition is monotonic in i, so the valid digits form a prefix whose length follows
+    from the smallest admissible order, found once from the exponent of `abs_err`.
+
+    Args:
+      abs_err (Union[Decimal, float]): The absolute error.
+      int_digits (int): The number of digits in the integer part.
+      total_digits (int): The total number of digits.
+
+    Returns:
+      int: The number of valid digits, between 0 and `total_digits`.
+    """
+    # Floats are converted exactly, matching a direct Decimal-to-float comparison.
+    abs_err = Decimal(abs_err)
+    if abs_err <= 0:
+        return total_digits
+    if abs_err.is_infinite():
+        return 0
+
+    # Smallest integer e with 5 * 10**e >= abs_err; digit i is valid when alpha - 1 >= e.
+    order = abs_err.adjusted()
+    if abs_err > _FIVE * _pow10(order):
+        order += 1
+    return min(max(int_digits - 1 - order, 0), total_digits)
+
+
+def _key(x: Optional[Union[Decimal, float, int, str]]) -> Optional[str]:
+    """
+    Return the cache key of an error function argument.
+
+    The error functions read their arguments through Decimal(str(x)), so the string
+    form fully determines the result. Unlike the Decimal itself it also keeps values
+    such as 1.5 and 1.50, which compare equal but have different digits, apart.
+    """
+    return None if x is None else str(x)
+
+
+@lru_cache(maxsize=1024)
+def _absolute_error(
+    value: str,
+    exact_value: Optional[str],
+    valid_digits: Optional[int],
+    rel_err: Optional[str],
+    return_type: Literal['Decimal', 'float'],
+    prec: int,
+) -> Union[Decimal, np.float64]:
+    """
+    Cached implementation of `absolute_error` on string arguments.
+
+    The arithmetic runs in a local context with `prec` significant digits; the precision
+    is part of the key because the results are rounded to it.
+    """
+    with localcontext() as ctx:
+        ctx.prec = prec
+        number = Decimal(value)
+
+        if exact_value is not None:
+            exact_value = Decimal(exact_value)
+            result = abs(exact_value - number)
+        elif valid_digits is not None:
+            if valid_digits <= 0:
+                raise ValueError('The number of valid digits must be positive')
+
+            if number == 0:
+                result = Decimal('0')
+            else:
+                # The last valid digit has order adjusted() - valid_digits + 1.
+                result = _FIVE * _pow10(number.adjusted() - valid_digits)
+        elif rel_err is not None:
+            rel_err = Decimal(rel_err)
+            if number == 0:
+                result = Decimal('0')
+            else:
+                result = abs(number) * rel_err
+        else:
+            # Exponent of the last stored digit; integers count from the units place.
+            exponent = number.as_tuple().exponent
+            order = min(exponent, 0) if number.is_finite() else 0
+            result = _FIVE * _pow10(order - 1)
+
+    return np.float64(result) if return_type == 'float' else result
+
+
+@lru_cache(maxsize=1024)
+def _relative_error(
+    value: str,
+    exact_value: Optional[str],
+    valid_digits: Optional[int],
+    abs_err: Optional[str],
+    return_type: Literal['Decimal', 'float'],
+    prec: int,
+) -> Union[Decimal, np.float64]:
+    """
+    Cached implementation of `relative_error` on string arguments.
+    """
+    with localcontext() as ctx:
+        ctx.prec = prec
+        number = Decimal(value)
+        if number == 0:
+            raise ValueError('Cannot calculate relative error for zero')
+
+        if exact_value is not None:
+            exact_value = Decimal(exact_value)
+            result = abs((exact_value - number) / exact_value)
+        elif valid_digits is not None:
+            if valid_digits <= 0:
+                raise ValueError('The number of valid digits must be positive')
+
+            result = _FIVE * _pow10(number.adjusted() - valid_digits) / abs(number)
+        elif abs_err is not None:
+            abs_err = Decimal(abs_err)
+            result = abs_err / abs(number)
+        else:
+            default = _absolute_error(value, None, None, None, 'Decimal', prec)
+            result = default / abs(number)
+
+    return np.float64(result) if return_type == 'float' else result
+
 
 def absolute_error(
     value: Union[Decimal, float, int, str],
@@ -35,43 +194,14 @@ def absolute_error(
     Returns:
       Union[Decimal, np.float64]: The absolute error.
     """
-    number = Decimal(str(value))
-
-    if exact_value is not None:
-        exact_value = Decimal(str(exact_value))
-        result = abs(exact_value - number)
-    elif valid_digits is not None:
-        if valid_digits <= 0:
-            raise ValueError('The number of valid digits must be positive')
-
-        str_value = format(number, 'f').lower().replace('.', '').lstrip('0')
-        if not str_value:
-            result = Decimal('0')
-        else:
-            first_non_zero_pos = len(
-                str(number).replace('.', '').lstrip('0')
-            ) - len(str_value)
-            order = len(str_value) - valid_digits - first_non_zero_pos
-            result = Decimal('5') * Decimal('10') ** Decimal(order)
-    elif rel_err is not None:
-        rel_err = Decimal(str(rel_err))
-        if number == 0:
-            result = Decimal('0')
-        else:
-            result = abs(number) * rel_err
-    else:
-        str_value = format(number, 'f')
-        if '.' in str_value:
-            fractional_part = str_value.split('.')[1]
-            if fractional_part:
-                order = -len(fractional_part)
-            else:
-                order = 0
-        else:
-            order = 0
-        result = Decimal('5') * Decimal('10') ** Decimal(order - 1)
-
-    return np.float64(result) if return_type == 'float' else result
+    return _absolute_error(
+        _key(value),
+        _key(exact_value),
+        valid_digits,
+        _key(rel_err),
+        return_type,
+        get_precision(),
+    )
 
 
 def relative_error(
@@ -102,32 +232,11 @@ def relative_error(
     Returns:
       Union[Decimal, np.float64]: The relative error.
     """
-    number = Decimal(str(value))
-    if number == 0:
-        raise ValueError('Cannot calculate relative error for zero')
-
-    if exact_value is not None:
-        exact_value = Decimal(str(exact_value))
-        result = abs((exact_value - number) / exact_value)
-    elif valid_digits is not None:
-        if valid_digits <= 0:
-            raise ValueError('The number of valid digits must be positive')
-
-        str_value = format(number, 'f').lower().replace('.', '').lstrip('0')
-        if not str_value:
-            result = Decimal('0')
-        else:
-            first_non_zero_pos = len(
-                str(number).replace('.', '').lstrip('0')
-            ) - len(str_value)
-            order = len(str_value) - valid_digits - first_non_zero_pos
-            result = (
-                Decimal('5') * Decimal('10') ** Decimal(order) / abs(number)
-            )
-    elif abs_err is not None:
-        abs_err = Decimal(str(abs_err))
-        result = abs_err / abs(number)
-    else:
-        result = absolute_error(number, return_type='Decimal') / abs(number)
-
-    return np.float64(result) if return_type == 'float' else result
+    return _relative_error(
+        _key(value),
+        _key(exact_value),
+        valid_digits,
+        _key(abs_err),
+        return_type,
+        get_precision(),
+    )
@@ -1,11 +1,11 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Literal, Union
 
 import numpy as np
 
-from .errors import absolute_error
+from ..utils import decimal_context
+from .errors import _to_dec, _valid_count, absolute_error
 
-getcontext().prec = 20
 __all__ = ['round_to']
 
 
@@ -13,6 +13,9 @@ class __RoundTo:
     """
     A class to round a number to a specified number of significant, valid, or doubtful digits.
 
+    Rounding runs in a local context with the package precision (see `set_precision`), so
+    the caller's decimal context is left untouched.
+
     Attributes:
       value (float): Union[Decimal, float, int, str].
     """
@@ -24,18 +27,16 @@ class __RoundTo:
         Args:
           value (float): Union[Decimal, float, int, str].
         """
-        self._dec_number = Decimal(str(value))
-        self._int_part = (
-            str(self._dec_number).split('.')[0][1:]
-            if self._dec_number < 0
-            else str(self._dec_number).split('.')[0]
-        )
-        self._frac_part = (
-            str(self._dec_number).split('.')[1]
-            if '.' in str(self._dec_number)
-            else ''
-        )
-
+        self._dec_number = _to_dec(value)
+        int_part, _, self._frac_part = str(self._dec_number).partition('.')
+        self._int_part = int_part.lstrip('-')
+        # Digit layout shared by sd, vd and dd: the digit string, the number of integer
+        # digits and the positions of the non-zero (significant) digits.
+        self._digits = self._int_part + self._frac_part
+        self._n_int = len(self._int_part)
+        self._nonzero = tuple(i for i, d in enumerate(self._digits) if d != '0')
+
+    @decimal_context
     def sd(
         self,
         num_digits: int = 1,
@@ -57,15 +58,13 @@ class __RoundTo:
         if num_digits <= 0:
             raise ValueError('num_digits must be greater than 0')
 
-        round_index = 0
-        significant_digits_count = 0
-        for i, digit in enumerate(self._int_part + self._frac_part):
-            if significant_digits_count == num_digits:
-                round_index = -(len(self._int_part) - i)
-                break
-
-            if digit != '0':
-                significant_digits_count += 1
+        # Rounding keeps everything up to the num_digits-th non-zero digit.
+        stop = (
+            self._nonzero[num_digits - 1] + 1
+            if num_digits <= len(self._nonzero)
+            else len(self._digits)
+        )
+        round_index = stop - self._n_int if stop < len(self._digits) else 0
 
         result = (
             self._dec_number
@@ -74,6 +73,7 @@ class __RoundTo:
         )
         return np.float64(result) if return_type == 'float' else result
 
+    @decimal_context
     def vd(
         self,
         abs_err: Union[Decimal, float, int, str] = None,
@@ -100,20 +100,16 @@ class __RoundTo:
         if abs_err is None:
             abs_err = absolute_error(self._dec_number)
         else:
-            abs_err = Decimal(str(abs_err))
-
-        round_index = 0
-        valid_digits_count = 0
-        for i in range(len(self._int_part) + len(self._frac_part)):
-            if valid_digits_count == num_digits:
-                round_index = -(len(self._int_part) - i)
-                break
-
-            alpha = len(self._int_part) - 2 - i
-            threshold = Decimal('5') * Decimal(10) ** Decimal(alpha)
-
-            if threshold >= abs_err:
-                valid_digits_count += 1
+            abs_err = _to_dec(abs_err)
+
+        # The valid digits are a prefix; rounding keeps the first num_digits of them.
+        total = len(self._digits)
+        count = _valid_count(abs_err, self._n_int, total)
+        round_index = (
+            num_digits - self._n_int
+            if num_digits <= count and num_digits < total
+            else 0
+        )
 
         result = (
             self._dec_number
@@ -122,6 +118,7 @@ class __RoundTo:
         )
         return np.float64(result) if return_type == 'float' else result
 
+    @decimal_context
     def dd(
         self,
         abs_err: Union[Decimal, float, int, str] = None,
@@ -148,20 +145,12 @@ class __RoundTo:
         if abs_err is None:
             abs_err = absolute_error(self._dec_number)
         else:
-            abs_err = Decimal(str(abs_err))
-
-        round_index = 0
-        doubtful_digits_count = 0
-        for i in range(len(self._int_part) + len(self._frac_part)):
-            if doubtful_digits_count == num_digits:
-                round_index = -(len(self._int_part) - i)
-                break
-
-            alpha = len(self._int_part) - 2 - i
-            threshold = Decimal('5') * Decimal(10) ** Decimal(alpha)
+            abs_err = _to_dec(abs_err)
 
-            if threshold < abs_err:
-                doubtful_digits_count += 1
+        # The doubtful digits follow the valid prefix; rounding keeps num_digits of them.
+        total = len(self._digits)
+        keep = _valid_count(abs_err, self._n_int, total) + num_digits
+        round_index = keep - self._n_int if keep < total else 0
 
         result = (
             self._dec_number
@@ -40,7 +40,7 @@ Features:
 Modules:
 --------
 - `fsolve`: Contains implementations of the secant and Newton's methods.
-- `sign_change_finder`: Provides automatic interval detection for root isolation.
+- `sign_change_finder`: Provides automatic interval detection for root isolation (grid scan or bisection).
 - `tridiagonal_alg`: Implements the Thomas algorithm for tridiagonal systems.
 
 Usage:
@@ -1,14 +1,73 @@
 from decimal import Decimal
 from typing import Callable, Literal, Union
+from weakref import WeakKeyDictionary
 
 import numpy as np
-from sympy import Basic, Symbol, diff, lambdify
+from sympy import Basic, Float, Symbol, diff, lambdify
 
-from ..utils import to_decimal
+from ..utils import decimal_context, get_precision, to_decimal
 
 __all__ = ['secant_solve', 'tangent_solve']
 
 
+# Compiled functions per symbolic function and variable name. The symbolic function is
+# held weakly, so an entry lives exactly as long as the caller keeps the function.
+_COMPILED: 'WeakKeyDictionary[Callable, dict]' = WeakKeyDictionary()
+
+
+def _build(
+    f_sym: Callable[[Symbol], Basic], x_sym: str
+) -> tuple[Callable, Callable, Basic, Basic, Symbol]:
+    """
+    Builds the numeric function and its derivative from a symbolic function.
+
+    The symbolic expressions are returned as well for the Decimal polishing step.
+    """
+    x = Symbol(x_sym)
+    f_expr = f_sym(x)
+    f_prime_expr = diff(f_expr, x)
+    # Common subexpressions (e.g. exp(x) in f' of exp(x)*sin(x)) are computed once.
+    f = lambdify(x, f_expr, modules='numpy', cse=True)
+    f_prime = lambdify(x, f_prime_expr, modules='numpy', cse=True)
+    return f, f_prime, f_expr, f_prime_expr, x
+
+
+def _compile(
+    f_sym: Callable[[Symbol], Basic], x_sym: str
+) -> tuple[Callable, Callable, Basic, Basic, Symbol]:
+    """
+    Returns the cached result of `_build`, building it on the first call.
+
+    Differentiation and lambdify dominate short solves, so the results are kept for
+    callers that solve the same equation repeatedly. The cache is keyed on the function
+    object: a lambda written inline in every call is a new object and is recompiled.
+    Functions that do not support weak references are compiled on every call.
+    """
+    try:
+        compiled = _COMPILED.setdefault(f_sym, {})
+    except TypeError:
+        return _build(f_sym, x_sym)
+    if x_sym not in compiled:
+        compiled[x_sym] = _build(f_sym, x_sym)
+    return compiled[x_sym]
+
+
+@decimal_context
+def _polish(f_expr: Basic, f_prime_expr: Basic, x: Symbol, root: float) -> Decimal:
+    """
+    Refines a float64 root with one Newton step evaluated at the package precision.
+
+    Newton's method converges quadratically, so a single step from a root accurate to
+    float64 gives all digits of the package precision (see `set_precision`).
+    """
+    prec = get_precision()
+    x_n = to_decimal(root)
+    subs = {x: Float(str(x_n), prec)}
+    f_val = Decimal(str(f_expr.evalf(prec, subs=subs)))
+    f_deriv = Decimal(str(f_prime_expr.evalf(prec, subs=subs)))
+    return x_n - f_val / f_deriv if f_deriv != 0 else x_n
+
+
 def tangent_solve(
     f_sym: Callable[[Symbol], Basic],
     x0: Union[Decimal, float, int, str],
@@ -31,25 +90,24 @@ def tangent_solve(
     Returns:
         tuple: (root approximation, number of iterations)
     """
-    x_sym = Symbol(x_sym)
-    f_expr = f_sym(x_sym)
-    f = lambdify(x_sym, f_expr)
-    f_prime_expr = diff(f_expr, x_sym)
-    f_prime = lambdify(x_sym, f_prime_expr)
-
-    x_n = x0
+    f, f_prime, f_expr, f_prime_expr, x = _compile(f_sym, x_sym)
 
+    # The iteration runs in native floats, as f and f' are evaluated in float64 anyway;
+    # a Decimal result is then polished once at the package precision.
+    x_n = float(x0)
     for i in range(1, max_iter + 1):
-        f_val = to_decimal(f(np.float64(x_n)))
-        f_deriv = to_decimal(f_prime(np.float64(x_n)))
+        f_val = float(f(x_n))
+        f_deriv = float(f_prime(x_n))
 
         if f_deriv == 0:
             raise ZeroDivisionError('Derivative is zero — the tangent is vertical.')
 
-        x_next = to_decimal(x_n) - f_val / f_deriv
+        x_next = x_n - f_val / f_deriv
 
-        if abs(x_next - to_decimal(x_n)) < to_decimal(eps):
-            return (np.float64(x_next) if return_type == 'float' else x_next), i
+        if abs(x_next - x_n) < eps:
+            if return_type == 'Decimal':
+                return _polish(f_expr, f_prime_expr, x, x_next), i
+            return np.float64(x_next), i
 
         x_n = x_next
 
@@ -80,13 +138,54 @@ def secant_solve(
     Returns:
         tuple: (root approximation, number of iterations)
     """
+    def f_at(x: Union[Decimal, float]) -> float:
+        return f(np.array([x], dtype=np.float64))[0]
+
+    # f(x_curr) is carried over as the next f(x_prev), so each step evaluates f once.
+    if return_type == 'float':
+        x_prev, x_curr = float(x0), float(x1)
+        f_prev, f_curr = float(f_at(x_prev)), float(f_at(x_curr))
+
+        for i in range(1, max_iter + 1):
+            denominator = f_curr - f_prev
+            if denominator == 0:
+                raise ZeroDivisionError(
+                    'Denominator is zero — two identical values of f(x).'
+                )
+
+            x_next = x_curr - f_curr * (x_curr - x_prev) / denominator
+
+            if abs(x_next - x_curr) < eps:
+                return np.float64(x_next), i
+
+            x_prev, x_curr = x_curr, x_next
+            f_prev, f_curr = f_curr, float(f_at(x_curr))
+
+        raise RuntimeError(
+            'The chord method did not converge in the given number of iterations.'
+        )
+
+    return _secant_decimal(f_at, x0, x1, eps, max_iter)
+
+
+@decimal_context
+def _secant_decimal(
+    f_at: Callable[[Decimal], float],
+    x0: Union[Decimal, float, int, str],
+    x1: Union[Decimal, float, int, str],
+    eps: float,
+    max_iter: int,
+) -> tuple[Decimal, int]:
+    """
+    Decimal secant iteration at the package precision.
+    """
     x_prev = to_decimal(x0)
     x_curr = to_decimal(x1)
+    eps = to_decimal(eps)
+    f_prev = to_decimal(f_at(x_prev))
+    f_curr = to_decimal(f_at(x_curr))
 
     for i in range(1, max_iter + 1):
-        f_prev = to_decimal(f(np.array([x_prev], dtype=np.float64))[0])
-        f_curr = to_decimal(f(np.array([x_curr], dtype=np.float64))[0])
-
         denominator = f_curr - f_prev
         if denominator == 0:
             raise ZeroDivisionError(
@@ -95,10 +194,11 @@ def secant_solve(
 
         x_next = x_curr - f_curr * (x_curr - x_prev) / denominator
 
-        if abs(x_next - x_curr) < to_decimal(eps):
-            return (np.float64(x_next) if return_type == 'float' else x_next), i
+        if abs(x_next - x_curr) < eps:
+            return x_next, i
 
         x_prev, x_curr = x_curr, x_next
+        f_prev, f_curr = f_curr, to_decimal(f_at(x_curr))
 
     raise RuntimeError(
         'The chord method did not converge in the given number of iterations.'
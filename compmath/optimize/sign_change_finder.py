@@ -8,6 +8,50 @@ from ..utils import to_decimal
 __all__ = ['find_sign_change_interval']
 
 
+def _scan(f: Callable, a: np.float64, b: np.float64, step: np.float64) -> tuple:
+    """
+    Returns the first grid interval of np.arange(a, b, step) on which f changes sign.
+    """
+    x_vals = np.arange(a, b, step)
+
+    # f is evaluated on the whole grid at once; points past the first sign change may be
+    # outside its domain, so their floating-point warnings are silenced.
+    with np.errstate(all='ignore'):
+        try:
+            y = np.broadcast_to(np.asarray(f(x_vals), dtype=np.float64), x_vals.shape)
+        except (TypeError, ValueError):
+            y = np.array([f(x) for x in x_vals], dtype=np.float64)
+
+    # Products of signs rather than of values, so that no product under- or overflows;
+    # as before, a zero value on either end does not count as a sign change.
+    signs = np.sign(y)
+    idx = np.flatnonzero(signs[:-1] * signs[1:] < 0)
+    if idx.size == 0:
+        raise ValueError(
+            'No interval with a sign change found within the specified range.'
+        )
+    return x_vals[idx[0]], x_vals[idx[0] + 1]
+
+
+def _bisect(f: Callable, a: np.float64, b: np.float64, step: np.float64) -> tuple:
+    """
+    Halves [a, b] until it is at most `step` wide, keeping a sign change inside.
+    """
+    sign_a, sign_b = np.sign(f(a)), np.sign(f(b))
+    if sign_a * sign_b >= 0:
+        raise ValueError('f(a) and f(b) must have opposite signs for bisection.')
+
+    while b - a > step:
+        m = (a + b) / 2
+        sign_m = np.sign(f(m))
+        # A zero at m is kept as the right end, so the interval still contains the root.
+        if sign_a * sign_m <= 0:
+            b = m
+        else:
+            a, sign_a = m, sign_m
+    return a, b
+
+
 def find_sign_change_interval(
     f: Callable[[Union[np.float64, np.ndarray]], Union[np.float64, np.ndarray]],
     search_range: tuple[
@@ -15,31 +59,40 @@ def find_sign_change_interval(
     ],
     step: np.float64 = 0.01,
     return_type: Literal['Decimal', 'float'] = 'float',
+    method: Literal['linear', 'bisect'] = 'linear',
 ) -> tuple[Union[np.float64, Decimal], Union[np.float64, Decimal]]:
     """
     Finds an interval [a, b] where f(x) changes sign (i.e., f(a)*f(b) < 0).
 
+    The linear method scans the grid np.arange(start, end, step) and returns its first
+    subinterval with a sign change. The bisection method needs f(start) and f(end) to have
+    opposite signs and halves the range until it is at most `step` wide, evaluating f only
+    O(log((end - start) / step)) times; if f changes sign several times it returns one of
+    them, not necessarily the first, and a root at a midpoint ends up as the right end.
+
     Args:
         f (Callable): Regular function using numpy methods.
         search_range (tuple): Search interval (start, end).
         step (np.float64): Iteration step.
         return_type (str): Return type: 'float' or 'Decimal'.
+        method (str): Search method: 'linear' or 'bisect'.
 
     Returns:
         tuple: Interval (a, b) where f changes sign.
 
     Raises:
         ValueError: If the sign doesn't change on any subinterval.
+        ValueError: If the method is 'bisect' and f(start) and f(end) have the same sign.
+        ValueError: If the method is unknown.
     """
     a, b = np.float64(search_range[0]), np.float64(search_range[1])
-    x_vals = np.arange(a, b, step)
-
-    for i in range(len(x_vals) - 1):
-        x0, x1 = x_vals[i], x_vals[i + 1]
-        y0, y1 = f(x0), f(x1)
-        if y0 * y1 < 0:
-            if return_type == 'Decimal':
-                return to_decimal(x0), to_decimal(x1)
-            return np.float64(x0), np.float64(x1)
+    if method == 'linear':
+        x0, x1 = _scan(f, a, b, step)
+    elif method == 'bisect':
+        x0, x1 = _bisect(f, a, b, step)
+    else:
+        raise ValueError("method must be 'linear' or 'bisect'")
 
-    raise ValueError('No interval with a sign change found within the specified range.')
+    if return_type == 'Decimal':
+        return to_decimal(x0), to_decimal(x1)
+    return np.float64(x0), np.float64(x1)
@@ -31,6 +31,7 @@ def thomasalg(
 
     Raises:
         ValueError: If the lengths of input arrays do not match the expected sizes.
+        ZeroDivisionError: If a pivot of the forward sweep is zero.
     """
     n = len(main_diag)
 
@@ -41,25 +42,28 @@ def thomasalg(
     if len(rhs_vector) != n:
         raise ValueError('Length of rhs_vector must be n')
 
-    lower_diag = np.concatenate([[0], np.asarray(lower_diag, dtype=float)])
-    upper_diag = np.concatenate([np.asarray(upper_diag, dtype=float), [0]])
-    main_diag = np.asarray(main_diag, dtype=float)
-    rhs_vector = np.asarray(rhs_vector, dtype=float)
+    # The sweeps are sequential recurrences, so they run on Python floats: indexing
+    # NumPy arrays element by element would box every scalar. The arithmetic, and so
+    # the result, is the same IEEE double arithmetic.
+    a = [0.0] + np.asarray(lower_diag, dtype=float).tolist()
+    c = np.asarray(upper_diag, dtype=float).tolist() + [0.0]
+    b = np.asarray(main_diag, dtype=float).tolist()
+    d = np.asarray(rhs_vector, dtype=float).tolist()
 
-    alpha = np.zeros(n)
-    beta = np.zeros(n)
+    alpha = [0.0] * n
+    beta = [0.0] * n
 
     for i in range(n - 1):
-        denominator = main_diag[i] + lower_diag[i] * alpha[i]
-        alpha[i + 1] = -upper_diag[i] / denominator
-        beta[i + 1] = (rhs_vector[i] - lower_diag[i] * beta[i]) / denominator
+        denominator = b[i] + a[i] * alpha[i]
+        alpha[i + 1] = -c[i] / denominator
+        beta[i + 1] = (d[i] - a[i] * beta[i]) / denominator
 
-    x = np.zeros(n)
-    x[n - 1] = (rhs_vector[n - 1] - lower_diag[n - 1] * beta[n - 1]) / (
-        main_diag[n - 1] + lower_diag[n - 1] * alpha[n - 1]
+    x = [0.0] * n
+    x[n - 1] = (d[n - 1] - a[n - 1] * beta[n - 1]) / (
+        b[n - 1] + a[n - 1] * alpha[n - 1]
     )
 
     for i in range(n - 2, -1, -1):
         x[i] = alpha[i + 1] * x[i + 1] + beta[i + 1]
 
-    return x
+    return np.array(x)
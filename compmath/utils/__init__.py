@@ -14,14 +14,24 @@ Features:
 - **Type Conversion**:
   - Convert various data types (e.g., `float`, `int`, `str`, `list`, `np.ndarray`) to `Decimal` for
     high-precision arithmetic.
+  - Convert a pair of node/value arrays at once with a single length check (`to_decimal_pair`).
+  - Prepare nodes and values once for repeated interpolation in either float64 or `Decimal`
+    (`prepare_nodes`), so the per-call conversion becomes a pass-through.
+
+- **Precision Control**:
+  - `set_precision` / `get_precision` choose the number of significant digits used by the package's
+    `Decimal` computations (`DEFAULT_PREC = 20`). Routines apply it through a local context
+    (`decimal_context`), so the caller's `decimal` context is left untouched.
 
 - **Mathematical Utilities**:
-  - Compute the factorial of an integer using efficient algorithms.
+  - Compute the factorial of an integer (exact Python integers from `math.factorial`,
+    float64 reciprocals 1/k! from a cached array via `inv_factorials`).
+  - Evaluate Newton-form polynomials with Horner's scheme (`horner`).
   - Provide helper functions for numerical computations.
 
 Modules:
 --------
-- `calc`: Contains mathematical utility functions, such as factorial computation.
+- `calc`: Contains mathematical utility functions, such as factorial computation and Horner evaluation.
 - `tools`: Provides type conversion utilities, such as converting numbers or arrays to `Decimal`.
 
 Usage:
@@ -1,16 +1,78 @@
+import math
+from decimal import Decimal
+from functools import lru_cache
+from typing import Sequence, Union
+
 import numpy as np
 
-__all__ = ['factorial']
+__all__ = ['factorial', 'horner', 'inv_factorials']
 
 
-def factorial(value: int) -> np.int64:
+def factorial(value: int) -> int:
     """
     Calculate the factorial of a given integer.
 
+    Results are exact Python integers (int64 would overflow beyond 20 factorial) computed
+    by the C implementation of `math.factorial`.
+
     Args:
         n (int): Input integer.
 
     Returns:
         int: Factorial of n.
+
+    Raises:
+        ValueError: If n is negative.
+    """
+    if value < 0:
+        raise ValueError('Factorial is not defined for negative integers')
+    return math.factorial(value)
+
+
+@lru_cache(maxsize=64)
+def inv_factorials(n: int) -> np.ndarray:
+    """
+    Return the reciprocals 1/k! for k = 1..n as a float64 array.
+
+    The table is cached per `n` and shared between calls, so it is marked read-only.
+    Entries past 170! underflow to zero.
+
+    Args:
+        n (int): Number of entries.
+
+    Returns:
+        np.ndarray: Read-only float64 array of length `n`.
+    """
+    inv = 1 / np.cumprod(np.arange(1, n + 1, dtype=np.float64))
+    inv.setflags(write=False)
+    return inv
+
+
+def horner(
+    coeffs: Sequence, offsets: Sequence, t: Union[Decimal, float]
+) -> Union[Decimal, float]:
+    """
+    Evaluate a Newton-form polynomial with Horner's scheme.
+
+    The polynomial is
+        P(t) = c_0 + (t - a_0) * (c_1 + (t - a_1) * (c_2 + ... + (t - a_{n-1}) * c_n))
+    which needs one multiplication per coefficient and no running product. Works for
+    `Decimal` and float coefficients alike.
+
+    Args:
+        coeffs (Sequence): Coefficients c_0, ..., c_n.
+        offsets (Sequence): Offsets a_0, ..., a_{n-1} (one fewer than `coeffs`).
+        t (Union[Decimal, float]): The evaluation point.
+
+    Returns:
+        Union[Decimal, float]: The value P(t), in the arithmetic of `coeffs` and `t`.
+
+    Raises:
+        ValueError: If `offsets` is not exactly one element shorter than `coeffs`.
     """
-    return np.prod([i for i in range(1, value + 1)])
+    if len(offsets) != len(coeffs) - 1:
+        raise ValueError('offsets must have exactly one element fewer than coeffs')
+    acc = coeffs[-1]
+    for k in range(len(coeffs) - 2, -1, -1):
+        acc = acc * (t - offsets[k]) + coeffs[k]
+    return acc
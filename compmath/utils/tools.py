@@ -1,9 +1,70 @@
-from decimal import Decimal
-from typing import Union
+from decimal import Decimal, localcontext
+from functools import wraps
+from typing import Callable, Literal, Union
 
 import numpy as np
 
-__all__ = ['to_decimal']
+__all__ = [
+    'DEFAULT_PREC',
+    'decimal_context',
+    'get_precision',
+    'prepare_nodes',
+    'set_precision',
+    'to_decimal',
+    'to_decimal_pair',
+]
+
+DEFAULT_PREC = 20
+_precision = DEFAULT_PREC
+
+
+def get_precision() -> int:
+    """
+    Return the number of significant digits used for the package's Decimal computations.
+
+    Returns:
+        int: Current precision. Defaults to `DEFAULT_PREC` (20).
+    """
+    return _precision
+
+
+def set_precision(prec: int) -> None:
+    """
+    Set the number of significant digits used for the package's Decimal computations.
+
+    The precision is applied through a local Decimal context inside each routine, so the
+    caller's own `decimal` context is never modified.
+
+    Args:
+        prec (int): Number of significant digits.
+
+    Raises:
+        ValueError: If prec is not a positive integer.
+    """
+    global _precision
+    if prec < 1:
+        raise ValueError('Precision must be a positive integer')
+    _precision = int(prec)
+
+
+def decimal_context(func: Callable) -> Callable:
+    """
+    Decorator running `func` inside a local Decimal context with the package precision.
+
+    Args:
+        func (Callable): Function performing Decimal arithmetic.
+
+    Returns:
+        Callable: Wrapped function.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with localcontext() as ctx:
+            ctx.prec = _precision
+            return func(*args, **kwargs)
+
+    return wrapper
 
 
 def to_decimal(
@@ -12,13 +73,91 @@ def to_decimal(
     """
     Convert input to Decimal or an array of Decimals.
 
+    Inputs that already hold Decimals (a Decimal scalar or an object array of
+    Decimals) are returned as-is without copying. Numbers are converted through their
+    shortest decimal representation, so 0.1 becomes Decimal('0.1') rather than the
+    exact binary value.
+
     Args:
         x: A number or list/array of numbers.
 
     Returns:
         Decimal or np.ndarray: Converted decimal(s).
     """
+    # Exact-type checks first: scalars are converted inside every solver loop.
+    t = type(obj)
+    if t is Decimal:
+        return obj
+    if t is float:
+        return Decimal(repr(obj))
+    if t is int:
+        return Decimal(obj)
+    if isinstance(obj, Decimal):
+        return obj
+    if isinstance(obj, np.ndarray) and obj.dtype == object:
+        if all(isinstance(x, Decimal) for x in obj.flat):
+            return obj
+    if isinstance(obj, np.ndarray) and (obj.dtype == np.float64 or obj.dtype.kind in 'iu'):
+        # Python floats and ints format like their NumPy scalars but much faster.
+        obj = obj.tolist()
     if isinstance(obj, list) or isinstance(obj, np.ndarray):
-        decimal_list = [Decimal(str(x)) for x in obj]
-        return np.array(decimal_list, dtype=object)
+        # map keeps the per-element conversion in C and fromiter fills the object array
+        # directly, without an intermediate list.
+        return np.fromiter(map(Decimal, map(str, obj)), dtype=object, count=len(obj))
+    if isinstance(obj, float):
+        return Decimal(repr(float(obj)))
     return Decimal(str(obj))
+
+
+def to_decimal_pair(
+    xp: Union[list, np.ndarray],
+    yp: Union[list, np.ndarray],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a pair of equally sized arrays (e.g. nodes and values) to Decimal arrays.
+
+    Args:
+        xp: First list/array of numbers.
+        yp: Second list/array of numbers.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Both inputs converted to Decimal arrays.
+
+    Raises:
+        ValueError: If xp and yp have different lengths.
+    """
+    if len(xp) != len(yp):
+        raise ValueError('Input arrays must have the same length')
+    return to_decimal(xp), to_decimal(yp)
+
+
+def prepare_nodes(
+    xp: Union[list, np.ndarray],
+    yp: Union[list, np.ndarray],
+    return_type: Literal['Decimal', 'float'] = 'float',
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert interpolation nodes and values once to the element type a routine works in.
+
+    Interpolation routines convert `xp` and `yp` on every call. Arrays that already have
+    the target type (float64 arrays for `return_type="float"`, Decimal object arrays for
+    `"Decimal"`) pass through that conversion without being copied, so preparing them
+    once pays off when many points are evaluated on the same data.
+
+    Args:
+        xp: Nodes as a list/array of numbers.
+        yp: Values at the nodes.
+        return_type (Literal["Decimal", "float"], optional): The `return_type` the prepared
+            arrays will be used with. Defaults to "float".
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: `xp` and `yp` as float64 or Decimal arrays.
+
+    Raises:
+        ValueError: If xp and yp have different lengths.
+    """
+    if return_type != 'float':
+        return to_decimal_pair(xp, yp)
+    if len(xp) != len(yp):
+        raise ValueError('Input arrays must have the same length')
+    return np.asarray(xp, dtype=np.float64), np.asarray(yp, dtype=np.float64)
@@ -0,0 +1,30 @@
+import math
+
+import numpy as np
+import pytest
+
+from compmath.interpolation import rem
+from compmath.utils import factorial
+
+
+def test_factorial_is_exact_past_int64():
+    # 21! overflowed the int64 product of the previous implementation.
+    assert factorial(20) == 2432902008176640000
+    assert factorial(21) == 51090942171709440000
+    assert factorial(30) == math.factorial(30)
+
+
+def test_factorial_rejects_negative_values():
+    with pytest.raises(ValueError):
+        factorial(-1)
+
+
+def test_rem_with_many_nodes():
+    # For f(x) = x**21 on 21 nodes the derivative f^(21) = 21! cancels the factorial,
+    # leaving R(x) = Π (x - x_i); a wrapped 21! would flip and scale the result.
+    xp = np.arange(21)
+    expected = math.prod(0.5 - xi for xi in range(21))
+
+    result = rem(0.5, xp, f=lambda x: x**21)
+
+    assert result == pytest.approx(expected, rel=1e-12)